@@ -0,0 +1,171 @@
+import os
+import socket
+import sys
+import threading
+import time
+
+import keystream
+import padpool
+import vernam
+import wire
+
+SIZES = [1024, 1024 * 1024, 1024 * 1024 * 1024]
+# the list implementation needs ~30x the payload in memory, so stop there
+LIST_LIMIT = 16 * 1024 * 1024
+
+
+def timeit(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def report(name, size, elapsed):
+    print(f"{name:<24} {size / elapsed / 1e6:10.2f} MB/s")
+
+
+def bench_xor(sizes):
+    for size in sizes:
+        data = os.urandom(size)
+        key = os.urandom(size)
+        out = bytearray(size)
+        print(f"-- vernam xor, {size} bytes")
+        if size <= LIST_LIMIT:
+            report(
+                "encrypt_bytes (list)", size, timeit(vernam.encrypt_bytes, data, key)
+            )
+        else:
+            print(f"{'encrypt_bytes (list)':<24} {'skipped':>10}")
+        report("xor_bytes", size, timeit(vernam.xor_bytes, data, key))
+        report("xor_bytes preallocated", size, timeit(vernam.xor_bytes, data, key, out))
+        report("xor_bytes in place", size, timeit(vernam.xor_bytes, out, key, out))
+
+
+def legacy_key(length):
+    key = []
+    seed = 12345
+    for i in range(length):
+        seed = (seed * 1103515245 + 12345) % (2**31)
+        key.append(seed % 256)
+    return key
+
+
+def bench_keystream(size=64 * 1024 * 1024):
+    print(f"-- keystream, {size} bytes")
+    small = min(size, LIST_LIMIT)
+    report("legacy LCG (list)", small, timeit(legacy_key, small))
+    report("LCGSource", size, timeit(keystream.LCGSource().read, size))
+    report("RandomSource", size, timeit(keystream.RandomSource().read, size))
+
+
+def legacy_send(c, ciphertext, key):
+    key_str = ",".join(map(str, key))
+    cipher_str = ",".join(map(str, ciphertext))
+    data = (key_str + "|" + cipher_str).encode()
+    c.sendall(data)
+    return len(data)
+
+
+def legacy_recv(s):
+    # the original receiver stopped after one recv(1024); read to EOF here so
+    # the comparison is against a version that actually works
+    chunks = []
+    while True:
+        part = s.recv(1 << 20)
+        if not part:
+            break
+        chunks.append(part)
+    parts = b"".join(chunks).decode().split("|")
+    key = list(map(int, parts[0].split(",")))
+    ciphertext = list(map(int, parts[1].split(",")))
+    return ciphertext, key
+
+
+def binary_send(c, ciphertext, key):
+    wire.send_message(c, ciphertext, key)
+    return wire.HEADER.size + len(key) + len(ciphertext)
+
+
+def _loopback(send, recv, ciphertext, key):
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+    sent = []
+
+    def serve():
+        c, addr = listener.accept()
+        try:
+            sent.append(send(c, ciphertext, key))
+        finally:
+            c.close()
+
+    thread = threading.Thread(target=serve)
+    thread.start()
+    start = time.perf_counter()
+    s = socket.create_connection(listener.getsockname())
+    try:
+        got, _ = recv(s)
+    finally:
+        s.close()
+    elapsed = time.perf_counter() - start
+    thread.join()
+    listener.close()
+    assert bytes(got) == bytes(ciphertext)
+    return sent[0], elapsed
+
+
+def bench_wire(size=4 * 1024 * 1024):
+    key = os.urandom(size)
+    ciphertext = os.urandom(size)
+    print(f"-- wire transfer, {size} byte message")
+    for name, send, recv in (
+        ("text (before)", legacy_send, legacy_recv),
+        ("binary (after)", binary_send, wire.recv_message),
+    ):
+        on_wire, elapsed = _loopback(send, recv, ciphertext, key)
+        print(f"{name:<24} {on_wire:12d} bytes {size / elapsed / 1e6:10.2f} MB/s")
+
+
+def _latency(cipher, size, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        cipher.generate_random_key(size)
+    return (time.perf_counter() - start) / count
+
+
+def bench_padpool(size=4096, count=2000):
+    print(f"-- key generation latency, {count} keys of {size} bytes")
+    direct = _latency(vernam.VernamCipher(), size, count)
+    print(f"{'RandomSource':<24} {direct * 1e6:10.1f} us/msg")
+    with padpool.PadPool(capacity=size * count * 2) as pool:
+        while pool.level < size * count:
+            time.sleep(0.01)
+        pooled = _latency(vernam.VernamCipher(pool), size, count)
+    print(f"{'PadPool':<24} {pooled * 1e6:10.1f} us/msg")
+
+
+def bench_batch(sizes=(16, 256, 4096), total=64 * 1024 * 1024):
+    cipher = vernam.VernamCipher(keystream.LCGSource())
+    for size in sizes:
+        count = total // size
+        messages = [os.urandom(size) for _ in range(min(count, 1000))]
+        messages = messages * (count // len(messages))
+        print(f"-- batch encrypt, {len(messages)} messages of {size} bytes")
+        start = time.perf_counter()
+        for m in messages[: len(messages) // 10]:
+            cipher.encrypt_data(m)
+        single = (len(messages) // 10) / (time.perf_counter() - start)
+        start = time.perf_counter()
+        cipher.encrypt_batch(messages)
+        batch = len(messages) / (time.perf_counter() - start)
+        print(f"{'encrypt_data per message':<24} {single:12.0f} msg/s")
+        print(f"{'encrypt_batch':<24} {batch:12.0f} msg/s")
+
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or SIZES
+    bench_xor(sizes)
+    bench_keystream()
+    bench_wire()
+    bench_padpool()
+    bench_batch()
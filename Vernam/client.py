@@ -1,13 +1,11 @@
 import socket
 
+import keystream
+import wire
 
-def generate_key(length):
-    key = []
-    seed = 12345
-    for i in range(length):
-        seed = (seed * 1103515245 + 12345) % (2**31)
-        key.append(seed % 256)
-    return key
+
+def generate_key(length, source=None):
+    return keystream.generate_key(length, source)
 
 
 def encrypt(plaintext, key):
@@ -19,21 +17,33 @@ def encrypt(plaintext, key):
     return ciphertext
 
 
-def send_data(ciphertext, key):
+def _accept():
     s = socket.socket()
     s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     port = 8080
     s.bind(("127.0.0.1", port))
     s.listen(5)
-    c, addr = s.accept()
     try:
-        key_str = ",".join(map(str, key))
-        cipher_str = ",".join(map(str, ciphertext))
-        data = key_str + "|" + cipher_str
-        c.sendall(data.encode())
+        c, addr = s.accept()
     finally:
-        c.close()
         s.close()
+    return c
+
+
+def send_data(ciphertext, key):
+    c = _accept()
+    try:
+        wire.send_message(c, ciphertext, key)
+    finally:
+        c.close()
+
+
+def send_file(cipher_path, key_path):
+    c = _accept()
+    try:
+        wire.send_files(c, cipher_path, key_path)
+    finally:
+        c.close()
 
 
 if __name__ == "__main__":
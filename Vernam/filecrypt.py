@@ -0,0 +1,113 @@
+import mmap
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import vernam
+
+# windows are a whole number of allocation units so every mapping offset is valid
+WINDOW = (16 * 1024 * 1024 // mmap.ALLOCATIONGRANULARITY) * mmap.ALLOCATIONGRANULARITY
+
+
+def _xor_window(src, pad, dst, start, length, pad_offset):
+    pad_start = pad_offset + start
+    delta = pad_start % mmap.ALLOCATIONGRANULARITY
+    sm = mmap.mmap(src.fileno(), length, offset=start, access=mmap.ACCESS_READ)
+    pm = mmap.mmap(
+        pad.fileno(), delta + length, offset=pad_start - delta, access=mmap.ACCESS_READ
+    )
+    dm = mmap.mmap(dst.fileno(), length, offset=start, access=mmap.ACCESS_WRITE)
+    try:
+        with memoryview(sm) as s, memoryview(pm) as p, memoryview(dm) as d:
+            with p[delta : delta + length] as key:
+                vernam.xor_bytes(s, key, d)
+    finally:
+        sm.close()
+        pm.close()
+        dm.close()
+
+
+def check_paths(src_path, pad_path, dst_path):
+    # the output is truncated before anything is read, so writing over the
+    # input or the pad would destroy it
+    if os.path.exists(dst_path):
+        for name, path in (("input", src_path), ("pad", pad_path)):
+            if os.path.samefile(dst_path, path):
+                raise ValueError(f"output is the same file as the {name}")
+
+
+def xor_file(
+    src_path,
+    pad_path,
+    dst_path,
+    pad_offset=0,
+    workers=1,
+    window=WINDOW,
+    progress=None,
+):
+    # encrypting and decrypting are the same operation; progress is called as
+    # progress(done_bytes, total_bytes, bytes_per_second) after every window
+    if window % mmap.ALLOCATIONGRANULARITY:
+        raise ValueError(f"window must be a multiple of {mmap.ALLOCATIONGRANULARITY}")
+    check_paths(src_path, pad_path, dst_path)
+    size = os.path.getsize(src_path)
+    available = os.path.getsize(pad_path) - pad_offset
+    if available < size:
+        raise ValueError(f"pad has {available} bytes left, need {size}")
+
+    with open(src_path, "rb") as src, open(pad_path, "rb") as pad, open(
+        dst_path, "w+b"
+    ) as dst:
+        dst.truncate(size)
+        if size == 0:
+            return 0
+
+        lock = threading.Lock()
+        done = 0
+        began = time.perf_counter()
+
+        def run(start):
+            nonlocal done
+            length = min(window, size - start)
+            _xor_window(src, pad, dst, start, length, pad_offset)
+            if progress is not None:
+                with lock:
+                    done += length
+                    elapsed = time.perf_counter() - began
+                    progress(done, size, done / elapsed if elapsed else 0.0)
+
+        starts = range(0, size, window)
+        if workers > 1:
+            # NumPy drops the GIL while XORing, so threads scale over disjoint windows
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(run, starts))
+        else:
+            for start in starts:
+                run(start)
+    return size
+
+
+encrypt_file = xor_file
+decrypt_file = xor_file
+
+
+def print_progress(done, total, rate):
+    print(f"\r{done * 100 // total:3d}%  {rate / 1e6:8.1f} MB/s", end="", flush=True)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 4:
+        print("Usage: filecrypt.py INPUT PAD OUTPUT [WORKERS]")
+        sys.exit(2)
+    workers = int(sys.argv[4]) if len(sys.argv) > 4 else os.cpu_count() or 1
+    try:
+        check_paths(sys.argv[1], sys.argv[2], sys.argv[3])
+    except ValueError as e:
+        print(f"filecrypt.py: {e}")
+        sys.exit(2)
+    xor_file(
+        sys.argv[1], sys.argv[2], sys.argv[3], workers=workers, progress=print_progress
+    )
+    print()
@@ -0,0 +1,103 @@
+import os
+
+import numpy as np
+
+CHUNK_SIZE = 1 << 20
+
+
+class LCGSource:
+    # same generator as the original generate_random_key:
+    # seed = (seed * 1103515245 + 12345) % 2**31, emitting seed % 256
+    A = 1103515245
+    C = 12345
+    M = 1 << 31
+
+    def __init__(self, seed=12345, block=1 << 16):
+        self.state = seed % self.M
+        self.mult, self.incr = self._jump_table(block)
+
+    def _jump_table(self, block):
+        # mult[i], incr[i] advance the state by i + 1 steps:
+        # state_{n+i+1} = (mult[i] * state_n + incr[i]) % M
+        mult = np.empty(block, dtype=np.uint64)
+        incr = np.empty(block, dtype=np.uint64)
+        mult[0], incr[0] = self.A, self.C
+        n = 1
+        while n < block:
+            m = min(n, block - n)
+            mult[n : n + m] = (mult[:m] * mult[n - 1]) % self.M
+            incr[n : n + m] = (mult[:m] * incr[n - 1] + incr[:m]) % self.M
+            n += m
+        return mult, incr
+
+    def fill(self, buf):
+        out = np.frombuffer(buf, dtype=np.uint8)
+        block = self.mult.size
+        state = np.uint64(self.state)
+        for start in range(0, out.size, block):
+            n = min(block, out.size - start)
+            states = (self.mult[:n] * state + self.incr[:n]) % self.M
+            out[start : start + n] = states & 0xFF
+            state = states[-1]
+        self.state = int(state)
+        return buf
+
+    def read(self, length):
+        return self.fill(bytearray(length))
+
+
+class RandomSource:
+    # OS CSPRNG, the source to use for real one-time pads
+
+    def __init__(self, chunk=CHUNK_SIZE):
+        self.chunk = chunk
+
+    def fill(self, buf):
+        view = memoryview(buf).cast("B")
+        for start in range(0, len(view), self.chunk):
+            n = min(self.chunk, len(view) - start)
+            view[start : start + n] = os.urandom(n)
+        return buf
+
+    def read(self, length):
+        return self.fill(bytearray(length))
+
+
+class FileSource:
+    # sequential reader over a pre-shared pad file; offset is where unused pad starts
+
+    def __init__(self, path, offset=0):
+        self.file = open(path, "rb")
+        self.size = os.fstat(self.file.fileno()).st_size
+        self.file.seek(offset)
+
+    @property
+    def offset(self):
+        return self.file.tell()
+
+    @property
+    def remaining(self):
+        return self.size - self.offset
+
+    def fill(self, buf):
+        view = memoryview(buf).cast("B")
+        if len(view) > self.remaining:
+            raise ValueError(
+                f"pad file has {self.remaining} bytes left, need {len(view)}"
+            )
+        got = 0
+        while got < len(view):
+            got += self.file.readinto(view[got:])
+        return buf
+
+    def read(self, length):
+        return self.fill(bytearray(length))
+
+    def close(self):
+        self.file.close()
+
+
+def generate_key(length, source=None):
+    if source is None:
+        source = RandomSource()
+    return source.read(length)
@@ -0,0 +1,114 @@
+import threading
+
+import keystream
+
+CAPACITY = 64 * 1024 * 1024
+CHUNK_SIZE = 1 << 20
+
+
+class PadPool:
+    # Background-filled ring buffer of pad bytes. take() returns the pad offset
+    # of the key it hands out: the source's own offset when it has one (a pad
+    # file), otherwise the count of bytes handed out so far.
+
+    def __init__(
+        self, source=None, capacity=CAPACITY, high_water=None, chunk=CHUNK_SIZE
+    ):
+        if high_water is None:
+            high_water = capacity
+        if not 0 < high_water <= capacity:
+            raise ValueError("high_water must be in (0, capacity]")
+        self.source = source if source is not None else keystream.RandomSource()
+        self.ring = bytearray(capacity)
+        self.capacity = capacity
+        self.high_water = high_water
+        self.chunk = min(chunk, high_water)
+        self.base = getattr(self.source, "offset", 0)
+        self.produced = 0
+        self.consumed = 0
+        self.error = None
+        self.closed = False
+        self.cond = threading.Condition()
+        self.take_lock = threading.Lock()
+        self.thread = threading.Thread(target=self._fill, daemon=True)
+        self.thread.start()
+
+    @property
+    def level(self):
+        return self.produced - self.consumed
+
+    def _fill(self):
+        view = memoryview(self.ring)
+        while True:
+            with self.cond:
+                while not self.closed and self.level >= self.high_water:
+                    self.cond.wait()
+                if self.closed:
+                    return
+                pos = self.produced % self.capacity
+                n = min(self.chunk, self.high_water - self.level, self.capacity - pos)
+                # finite sources (pad files) are drained exactly, not overrun
+                remaining = getattr(self.source, "remaining", None)
+                if remaining is not None:
+                    n = min(n, remaining)
+            # the region past `produced` belongs to the producer until it is published
+            try:
+                if n == 0:
+                    raise ValueError("pad source exhausted")
+                self.source.fill(view[pos : pos + n])
+            except Exception as e:
+                with self.cond:
+                    self.error = e
+                    self.cond.notify_all()
+                return
+            with self.cond:
+                self.produced += n
+                self.cond.notify_all()
+
+    def take_into(self, buf):
+        view = memoryview(buf).cast("B")
+        ring = memoryview(self.ring)
+        with self.take_lock:
+            offset = self.base + self.consumed
+            got = 0
+            while got < len(view):
+                with self.cond:
+                    while self.level == 0:
+                        if self.error is not None:
+                            raise self.error
+                        if self.closed:
+                            raise ValueError("pad pool is closed")
+                        self.cond.wait()
+                    pos = self.consumed % self.capacity
+                    n = min(len(view) - got, self.level, self.capacity - pos)
+                view[got : got + n] = ring[pos : pos + n]
+                got += n
+                with self.cond:
+                    self.consumed += n
+                    self.cond.notify_all()
+        return offset
+
+    def take(self, length):
+        key = bytearray(length)
+        offset = self.take_into(key)
+        return offset, key
+
+    # source interface, so a pool can be handed to VernamCipher directly
+    def fill(self, buf):
+        self.take_into(buf)
+        return buf
+
+    def read(self, length):
+        return self.take(length)[1]
+
+    def close(self):
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+        self.thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,5 +1,7 @@
 import socket
 
+import wire
+
 
 def decrypt(ciphertext, key):
     if len(ciphertext) != len(key):
@@ -14,18 +16,14 @@ def receive_data():
     s = socket.socket()
     port = 8080
     s.connect(("127.0.0.1", port))
-    data = s.recv(1024).decode()
-    s.close()
-
-    parts = data.split("|")
-    key = list(map(int, parts[0].split(",")))
-    ciphertext = list(map(int, parts[1].split(",")))
-
-    return ciphertext, key
+    try:
+        return wire.recv_message(s)
+    finally:
+        s.close()
 
 
 if __name__ == "__main__":
     ciphertext, key = receive_data()
     decrypted = decrypt(ciphertext, key)
     print("Decrypted: ", decrypted)
-    print("Received: ", ciphertext)
+    print("Received: ", list(ciphertext))
@@ -1,3 +1,8 @@
+import numpy as np
+
+import keystream
+
+
 def generate_key(length):
     key = []
     for i in range(length):
@@ -41,6 +46,41 @@ def decrypt_bytes(data, key):
     return result
 
 
+def _buffer(data):
+    if isinstance(data, (list, tuple)):
+        return bytes(data)
+    return data
+
+
+def xor_bytes(data, key, out=None):
+    # accepts any buffer (bytes, bytearray, memoryview, mmap); pass out=data
+    # to XOR a writable buffer in place
+    a = np.frombuffer(_buffer(data), dtype=np.uint8)
+    k = np.frombuffer(_buffer(key), dtype=np.uint8)
+    if a.size != k.size:
+        return None
+    if out is None:
+        out = bytearray(a.size)
+    np.bitwise_xor(a, k, out=np.frombuffer(out, dtype=np.uint8))
+    return out
+
+
+def pack(messages):
+    # one contiguous buffer plus offsets; message i is buffer[offsets[i]:offsets[i + 1]]
+    bufs = [m.encode() if isinstance(m, str) else m for m in messages]
+    offsets = np.zeros(len(bufs) + 1, dtype=np.int64)
+    np.cumsum(
+        np.fromiter(map(len, bufs), dtype=np.int64, count=len(bufs)), out=offsets[1:]
+    )
+    return b"".join(bufs), offsets
+
+
+def unpack(buffer, offsets):
+    view = memoryview(buffer)
+    bounds = offsets.tolist()
+    return [view[a:b] for a, b in zip(bounds, bounds[1:])]
+
+
 def text_to_bytes(text):
     return [ord(c) for c in text]
 
@@ -50,16 +90,12 @@ def bytes_to_text(data):
 
 
 class VernamCipher:
-    def __init__(self):
-        pass
+    def __init__(self, source=None):
+        # pass keystream.LCGSource(12345) for the old reproducible keys
+        self.source = source if source is not None else keystream.RandomSource()
 
     def generate_random_key(self, length):
-        key = []
-        seed = 12345
-        for i in range(length):
-            seed = (seed * 1103515245 + 12345) % (2**31)
-            key.append(seed % 256)
-        return key
+        return self.source.read(length)
 
     def encrypt_text(self, plaintext, key=None):
         if key is None:
@@ -69,10 +105,27 @@ class VernamCipher:
     def decrypt_text(self, ciphertext, key):
         return decrypt(ciphertext, key)
 
-    def encrypt_data(self, data, key=None):
+    def encrypt_data(self, data, key=None, out=None):
         if key is None:
             key = self.generate_random_key(len(data))
-        return encrypt_bytes(data, key), key
+        return xor_bytes(data, key, out), key
 
-    def decrypt_data(self, ciphertext, key):
-        return decrypt_bytes(ciphertext, key)
+    def decrypt_data(self, ciphertext, key, out=None):
+        return xor_bytes(ciphertext, key, out)
+
+    def encrypt_batch(self, messages, key=None):
+        # a single key covers the whole batch; message i uses key[offsets[i]:offsets[i + 1]]
+        data, offsets = pack(messages)
+        if key is None:
+            key = self.generate_random_key(len(data))
+        out = xor_bytes(data, key)
+        if out is None:
+            return None, offsets, key
+        return unpack(out, offsets), offsets, key
+
+    def decrypt_batch(self, ciphertexts, key):
+        data, offsets = pack(ciphertexts)
+        out = xor_bytes(data, key)
+        if out is None:
+            return None
+        return unpack(out, offsets)
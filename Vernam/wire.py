@@ -0,0 +1,54 @@
+import os
+import struct
+
+# key length, ciphertext length; the raw key and ciphertext bytes follow
+HEADER = struct.Struct("!QQ")
+# largest pad/ciphertext a receiver will allocate for
+MAX_MESSAGE = 1 << 30
+
+
+def _buffer(data):
+    if isinstance(data, (list, tuple)):
+        return bytes(data)
+    return data
+
+
+def recv_into(sock, buf):
+    view = memoryview(buf).cast("B")
+    got = 0
+    while got < len(view):
+        n = sock.recv_into(view[got:])
+        if n == 0:
+            raise ConnectionError(f"connection closed after {got} of {len(view)} bytes")
+        got += n
+    return buf
+
+
+def send_message(sock, ciphertext, key):
+    key = _buffer(key)
+    ciphertext = _buffer(ciphertext)
+    sock.sendall(HEADER.pack(len(key), len(ciphertext)))
+    sock.sendall(key)
+    sock.sendall(ciphertext)
+
+
+def send_files(sock, cipher_path, key_path):
+    # file payloads go out through sendfile, so they never pass through Python
+    with open(key_path, "rb") as kf, open(cipher_path, "rb") as cf:
+        sock.sendall(
+            HEADER.pack(os.fstat(kf.fileno()).st_size, os.fstat(cf.fileno()).st_size)
+        )
+        sock.sendfile(kf)
+        sock.sendfile(cf)
+
+
+def recv_message(sock, max_size=MAX_MESSAGE):
+    header = recv_into(sock, bytearray(HEADER.size))
+    key_len, cipher_len = HEADER.unpack(header)
+    if key_len != cipher_len:
+        raise ValueError(f"key of {key_len} bytes for {cipher_len} bytes of ciphertext")
+    if cipher_len > max_size:
+        raise ValueError(f"message of {cipher_len} bytes exceeds limit")
+    key = recv_into(sock, bytearray(key_len))
+    ciphertext = recv_into(sock, bytearray(cipher_len))
+    return ciphertext, key
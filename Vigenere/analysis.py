@@ -0,0 +1,103 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# relative frequencies of a-z in English text
+ENGLISH = np.array(
+    [
+        8.167, 1.492, 2.782, 4.253, 12.702, 2.228, 2.015, 6.094, 6.966,
+        0.153, 0.772, 4.025, 2.406, 6.749, 7.507, 1.929, 0.095, 5.987,
+        6.327, 9.056, 2.758, 0.978, 2.360, 0.150, 1.974, 0.074,
+    ]
+)  # fmt: skip
+ENGLISH = ENGLISH / ENGLISH.sum()
+ENGLISH_IC = float((ENGLISH**2).sum())
+
+# ROTATE[k, j] is the ciphertext letter that becomes j when shifted back by k
+ROTATE = (np.arange(26)[None, :] + np.arange(26)[:, None]) % 26
+
+
+def letter_values(text):
+    # 0-25 for every ASCII letter, case folded; the key only advances on these
+    if isinstance(text, str):
+        text = text.encode()
+    data = np.frombuffer(text, dtype=np.uint8)
+    index = (data | 0x20) - 97
+    return index[index < 26]
+
+
+def _column_counts(vals, period):
+    cols = np.arange(vals.size) % period
+    return np.bincount(cols * 26 + vals, minlength=period * 26).reshape(period, 26)
+
+
+def index_of_coincidence(vals, max_period=20):
+    # ic[p - 1] is the mean IC of the p columns when the text is split with period p
+    ic = np.zeros(max_period)
+    for period in range(1, max_period + 1):
+        counts = _column_counts(vals, period)
+        n = counts.sum(axis=1)
+        pairs = (counts * (counts - 1)).sum(axis=1)
+        valid = n > 1
+        if valid.any():
+            ic[period - 1] = (pairs[valid] / (n[valid] * (n[valid] - 1))).mean()
+    return ic
+
+
+def kasiski(vals, max_period=20, ngram=3):
+    # votes[p - 1] counts distances between repeated n-grams that p divides
+    if vals.size < ngram:
+        return np.zeros(max_period, dtype=np.int64)
+    codes = np.zeros(vals.size - ngram + 1, dtype=np.int64)
+    for i in range(ngram):
+        codes = codes * 26 + vals[i : vals.size - ngram + 1 + i]
+    order = np.argsort(codes, kind="stable")
+    repeat = codes[order[1:]] == codes[order[:-1]]
+    distances = (order[1:] - order[:-1])[repeat]
+    periods = np.arange(1, max_period + 1)
+    return (distances[None, :] % periods[:, None] == 0).sum(axis=1)
+
+
+def kasiski_period(vals, max_period=20):
+    # the period with the most votes relative to the share of distances it would
+    # divide by chance; used to cross-check guess_period, not to pick the key
+    max_period = max(1, min(max_period, vals.size // 2))
+    votes = kasiski(vals, max_period)
+    return int(np.argmax(votes * np.arange(1, max_period + 1))) + 1
+
+
+def guess_period(vals, max_period=20):
+    # the smallest period whose IC is close to the best one; multiples of the
+    # true period score just as well, so taking the max alone overshoots
+    max_period = max(1, min(max_period, vals.size // 2))
+    ic = index_of_coincidence(vals, max_period)
+    threshold = min(ic.max(), ENGLISH_IC) * 0.9
+    return int(np.argmax(ic >= threshold)) + 1
+
+
+def recover_shifts(vals, period):
+    counts = _column_counts(vals, period)
+    total = np.maximum(counts.sum(axis=1, keepdims=True), 1)
+    expected = (total * ENGLISH)[:, None, :]
+    chi = (((counts[:, ROTATE] - expected) ** 2) / expected).sum(axis=-1)
+    return np.argmin(chi, axis=1)
+
+
+def crack(ciphertxt, max_period=20):
+    vals = letter_values(ciphertxt)
+    if vals.size == 0:
+        return ""
+    period = guess_period(vals, max_period)
+    return (recover_shifts(vals, period) + 97).astype(np.uint8).tobytes().decode()
+
+
+def crack_batch(ciphertexts, max_period=20, workers=None):
+    if workers == 1:
+        return [crack(c, max_period) for c in ciphertexts]
+    chunksize = max(1, len(ciphertexts) // ((workers or 8) * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(
+            pool.map(
+                crack, ciphertexts, [max_period] * len(ciphertexts), chunksize=chunksize
+            )
+        )
@@ -0,0 +1,182 @@
+import socket
+import sys
+import threading
+import time
+
+import numpy as np
+
+import analysis
+import client
+import server
+import tabula
+import wire
+
+
+def sample(size):
+    text = "Attack at Dawn, hold the Eastern bridge until 0600! "
+    return (text * (size // len(text) + 1))[:size]
+
+
+def timeit(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def report(name, size, elapsed):
+    print(f"{name:<28} {size / elapsed / 1e6:10.2f} MB/s")
+
+
+def legacy_encrypt(string, partial_key):
+    full_key = client.keygen(string, partial_key)
+    ciphertxt = ""
+    for i, ch in enumerate(string):
+        if not ch.isalpha():
+            ciphertxt += ch
+            continue
+        k = full_key[i]
+        if ch.islower():
+            ciphertxt += chr(((ord(ch) + ord(k) - 2 * ord("a")) % 26) + ord("a"))
+        else:
+            ciphertxt += chr(((ord(ch) + ord(k) - 2 * ord("A")) % 26) + ord("A"))
+    return ciphertxt
+
+
+def legacy_decrypt(string, key):
+    plaintxt = ""
+    aligned = len(key) == len(string)
+    key_pos = 0
+    for i, ch in enumerate(string):
+        if not ch.isalpha():
+            plaintxt += ch
+            continue
+        if aligned:
+            k = key[i]
+        else:
+            k = key[key_pos] if key_pos < len(key) else "a"
+            key_pos += 1
+        if not k.isalpha():
+            k = "a"
+        if ch.islower():
+            k = k.lower()
+            plaintxt += chr(((ord(ch) - ord(k) + 26) % 26) + ord("a"))
+        else:
+            k = k.upper()
+            plaintxt += chr(((ord(ch) - ord(k) + 26) % 26) + ord("A"))
+    return plaintxt
+
+
+def bench_tabula(size, key="lemon"):
+    text = sample(size)
+    full_key = client.keygen(text, key)
+    ciphertxt = tabula.encrypt(text, key)
+    print(f"-- vigenere, {size} bytes")
+    report("legacy encrypt", size, timeit(legacy_encrypt, text, key))
+    report(
+        "legacy decrypt (full key)", size, timeit(legacy_decrypt, ciphertxt, full_key)
+    )
+    report("client.encrypt", size, timeit(client.encrypt, text, key))
+    report(
+        "server.decrypt (full key)", size, timeit(server.decrypt, ciphertxt, full_key)
+    )
+    report("tabula.decrypt (partial key)", size, timeit(tabula.decrypt, ciphertxt, key))
+
+
+def synthetic_corpus(count, size, seed=0):
+    rng = np.random.default_rng(seed)
+    letters = rng.choice(26, size=(count, size), p=analysis.ENGLISH) + 97
+    texts = [row.astype(np.uint8).tobytes().decode() for row in letters]
+    keys = []
+    for _ in range(count):
+        period = int(rng.integers(3, 13))
+        keys.append(
+            (rng.integers(0, 26, period) + 97).astype(np.uint8).tobytes().decode()
+        )
+    return [tabula.encrypt(t, k) for t, k in zip(texts, keys)], keys
+
+
+def bench_analysis(count=2000, size=1000):
+    ciphertexts, keys = synthetic_corpus(count, size)
+    print(f"-- key recovery, {count} ciphertexts of {size} letters")
+    for name, workers in (("serial", 1), ("process pool", None)):
+        start = time.perf_counter()
+        found = analysis.crack_batch(ciphertexts, workers=workers)
+        elapsed = time.perf_counter() - start
+        hits = sum(f == k for f, k in zip(found, keys))
+        print(f"{name:<28} {count / elapsed:10.0f} ciphertexts/s  {hits}/{count} keys")
+    agree = 0
+    for ciphertxt in ciphertexts:
+        vals = analysis.letter_values(ciphertxt)
+        agree += analysis.kasiski_period(vals) == analysis.guess_period(vals)
+    print(f"{'Kasiski agrees with IC':<28} {agree:10d}/{count} periods")
+
+
+def _listener():
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(128)
+    return listener
+
+
+def _per_message(frames):
+    listener = _listener()
+
+    def serve():
+        for ciphertxt, key in frames:
+            c, addr = listener.accept()
+            try:
+                wire.send_message(c, ciphertxt, key)
+            finally:
+                c.close()
+
+    thread = threading.Thread(target=serve)
+    thread.start()
+    for _ in frames:
+        s = socket.create_connection(listener.getsockname())
+        try:
+            key, ciphertxt = wire.recv_message(s)
+        finally:
+            s.close()
+        tabula.decrypt(ciphertxt, key)
+    thread.join()
+    listener.close()
+
+
+def _session(frames):
+    listener = _listener()
+
+    def serve():
+        c, addr = listener.accept()
+        try:
+            wire.send_messages(c, frames)
+        finally:
+            c.close()
+
+    thread = threading.Thread(target=serve)
+    thread.start()
+    s = socket.create_connection(listener.getsockname())
+    try:
+        received = sum(1 for _ in server.decrypt_session(s))
+    finally:
+        s.close()
+    thread.join()
+    listener.close()
+    assert received == len(frames)
+
+
+def bench_session(count=5000, size=256, key="lemon"):
+    frames = [(tabula.encrypt(sample(size), key), key)] * count
+    print(f"-- transport, {count} messages of {size} bytes")
+    for name, run in (
+        ("connection per message", _per_message),
+        ("persistent session", _session),
+    ):
+        elapsed = timeit(run, frames)
+        print(f"{name:<28} {count / elapsed:10.0f} msg/s")
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10 * 1024 * 1024
+    bench_tabula(size)
+    bench_analysis()
+    bench_session()
@@ -1,4 +1,8 @@
 import socket
+import sys
+
+import tabula
+import wire
 
 
 def keygen(plaintext, partial_key):
@@ -20,6 +24,8 @@ def keygen(plaintext, partial_key):
 
 
 def encrypt(string, partial_key):
+    if partial_key and string.isascii() and partial_key.isascii():
+        return tabula.encrypt(string, partial_key)
     full_key = keygen(string, partial_key)
     ciphertxt = ""
     for i, ch in enumerate(string):
@@ -50,12 +56,57 @@ def transmit(string, key):
             c.close()
 
 
+def transmit_partial_key(string, partial_key):
+    # only the partial key travels; the receiver rebuilds the keystream itself
+    data = wire.pack_message(string, partial_key)
+    s = socket.socket()
+    port = 8080
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    s.bind(("127.0.0.1", port))
+    s.listen(5)
+    while True:
+        c, addr = s.accept()
+        try:
+            c.sendall(data)
+        finally:
+            c.close()
+
+
+def transmit_session(strings, partial_key):
+    # one connection per receiver carrying every message back to back; the
+    # frames are encrypted and packed once and reused for every receiver
+    payload = wire.pack_messages(
+        (tabula.encrypt(m, partial_key), partial_key) for m in strings
+    )
+    s = socket.socket()
+    port = 8080
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    s.bind(("127.0.0.1", port))
+    s.listen(5)
+    while True:
+        c, addr = s.accept()
+        try:
+            c.sendall(payload)
+        finally:
+            c.close()
+
+
 if __name__ == "__main__":
-    plaintxt = input("Enter the plaintext to encrypt: ")
-    key = input("Enter the key: ")
-    full_key = keygen(plaintxt, key)
-    ciph = encrypt(plaintxt, key)
-    print(ciph)
-    print(full_key)
-    transmit(ciph, full_key)
-    print("Sent")
+    if "--session" in sys.argv:
+        key = input("Enter the key: ")
+        print("Enter one plaintext per line, end with an empty line:")
+        transmit_session(list(iter(input, "")), key)
+    else:
+        plaintxt = input("Enter the plaintext to encrypt: ")
+        key = input("Enter the key: ")
+        if "--partial-key" in sys.argv:
+            ciph = tabula.encrypt(plaintxt, key)
+            print(ciph)
+            transmit_partial_key(ciph, key)
+        else:
+            full_key = keygen(plaintxt, key)
+            ciph = encrypt(plaintxt, key)
+            print(ciph)
+            print(full_key)
+            transmit(ciph, full_key)
+        print("Sent")
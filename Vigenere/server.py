@@ -1,4 +1,10 @@
+import queue
 import socket
+import sys
+import threading
+
+import tabula
+import wire
 
 
 def decrypt(string, key):
@@ -6,6 +12,8 @@ def decrypt(string, key):
 
     if not key:
         return string
+    if string.isascii() and key.isascii():
+        return tabula.decrypt_full_key(string, key)
     aligned = len(key) == len(string)
     key_pos = 0
     for i, ch in enumerate(string):
@@ -53,8 +61,87 @@ def receive():
     return (key, txt)
 
 
+def receive_partial_key():
+    s = socket.socket()
+    port = 8080
+    s.connect(("127.0.0.1", port))
+    try:
+        return wire.recv_message(s)
+    finally:
+        s.close()
+
+
+def decrypt_session(sock, depth=1024):
+    # a reader thread keeps pulling frames off the socket while the caller
+    # decrypts, so network reads and decrypts overlap
+    frames = queue.Queue(depth)
+    done = object()
+    stop = threading.Event()
+
+    def put(item):
+        # gives up once the caller has stopped iterating, so an abandoned
+        # session does not leave the reader blocked on a full queue
+        while not stop.is_set():
+            try:
+                frames.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def read():
+        try:
+            for frame in wire.recv_messages(sock):
+                if not put(frame):
+                    return
+        except Exception as e:
+            if not put(e):
+                return
+        put(done)
+
+    reader = threading.Thread(target=read, daemon=True)
+    reader.start()
+    try:
+        while True:
+            frame = frames.get()
+            if frame is done:
+                break
+            if isinstance(frame, Exception):
+                raise frame
+            key, ciphertxt = frame
+            yield (ciphertxt, tabula.decrypt(ciphertxt, key))
+    finally:
+        stop.set()
+        if reader.is_alive():
+            # wake a reader still blocked in recv
+            try:
+                sock.shutdown(socket.SHUT_RD)
+            except OSError:
+                pass
+        reader.join()
+
+
+def receive_session():
+    s = socket.socket()
+    port = 8080
+    s.connect(("127.0.0.1", port))
+    try:
+        yield from decrypt_session(s)
+    finally:
+        s.close()
+
+
 if __name__ == "__main__":
-    key, ciphertxt = receive()
-    plaintxt = decrypt(ciphertxt, key)
-    print("Received: " + ciphertxt)
-    print("Decrypted: " + plaintxt)
+    if "--session" in sys.argv:
+        for ciphertxt, plaintxt in receive_session():
+            print("Received: " + ciphertxt)
+            print("Decrypted: " + plaintxt)
+    else:
+        if "--partial-key" in sys.argv:
+            key, ciphertxt = receive_partial_key()
+            plaintxt = tabula.decrypt(ciphertxt, key)
+        else:
+            key, ciphertxt = receive()
+            plaintxt = decrypt(ciphertxt, key)
+        print("Received: " + ciphertxt)
+        print("Decrypted: " + plaintxt)
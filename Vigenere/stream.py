@@ -0,0 +1,72 @@
+import sys
+
+import tabula
+
+CHUNK_SIZE = 1 << 20
+
+
+class Encoder:
+    decrypt = False
+
+    def __init__(self, key, phase=0):
+        # phase is the index into key of the next letter's shift; it only
+        # advances on letters, exactly like kp in client.keygen
+        self.key = key
+        self.phase = phase % len(key)
+
+    def update(self, chunk):
+        out, self.phase = tabula.shift(chunk, self.key, self.decrypt, self.phase)
+        return out
+
+
+class Decoder(Encoder):
+    decrypt = True
+
+
+def iter_chunks(source, size=CHUNK_SIZE):
+    if not hasattr(source, "read"):
+        yield from source
+        return
+    while True:
+        chunk = source.read(size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def encrypt_stream(source, key, size=CHUNK_SIZE):
+    encoder = Encoder(key)
+    for chunk in iter_chunks(source, size):
+        yield encoder.update(chunk)
+
+
+def decrypt_stream(source, key, size=CHUNK_SIZE):
+    decoder = Decoder(key)
+    for chunk in iter_chunks(source, size):
+        yield decoder.update(chunk)
+
+
+def pipe(mode, key, src, dst, size=CHUNK_SIZE):
+    stream = encrypt_stream if mode == "encrypt" else decrypt_stream
+    total = 0
+    for chunk in stream(src, key, size):
+        dst.write(chunk)
+        total += len(chunk)
+    dst.flush()
+    return total
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3 or sys.argv[1] not in ("encrypt", "decrypt"):
+        print("Usage: stream.py encrypt|decrypt KEY [INPUT] [OUTPUT]")
+        sys.exit(2)
+    mode, key = sys.argv[1], sys.argv[2]
+    src = open(sys.argv[3], "rb") if len(sys.argv) > 3 else sys.stdin.buffer
+    dst = open(sys.argv[4], "wb") if len(sys.argv) > 4 else sys.stdout.buffer
+    try:
+        pipe(mode, key, src, dst)
+    finally:
+        if src is not sys.stdin.buffer:
+            src.close()
+        if dst is not sys.stdout.buffer:
+            dst.close()
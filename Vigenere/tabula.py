@@ -0,0 +1,89 @@
+import numpy as np
+
+
+def _key_shifts(key):
+    # shift applied to lowercase and uppercase letters for each key char,
+    # computed the same way as the per-char code (k.lower() / k.upper())
+    if not key.isascii():
+        raise ValueError("key must be ASCII")
+    lower = np.frombuffer(key.lower().encode("ascii"), dtype=np.uint8).astype(np.int16)
+    upper = np.frombuffer(key.upper().encode("ascii"), dtype=np.uint8).astype(np.int16)
+    return ((lower - 97) % 26).astype(np.uint8), ((upper - 65) % 26).astype(np.uint8)
+
+
+def _letters(data):
+    # positions of the letters, their 0-25 values and the case base to add back;
+    # folding to lowercase with | 0x20 leaves only letters in 0-25 after - 97
+    index = (data | 0x20) - 97
+    pos = np.flatnonzero(index < 26)
+    return pos, index[pos], (data[pos] & 0x20) + 65
+
+
+def _tile(vals, shifts):
+    # add the key to the letters period by period without building a full-length key
+    period = shifts.size
+    rows = -(-vals.size // period)
+    padded = np.zeros(rows * period, dtype=np.uint8)
+    padded[: vals.size] = vals
+    grid = padded.reshape(rows, period)
+    grid += shifts
+    grid %= 26
+    return padded[: vals.size]
+
+
+def _as_array(text):
+    if isinstance(text, str):
+        return np.frombuffer(text.encode(), dtype=np.uint8)
+    return np.frombuffer(text, dtype=np.uint8)
+
+
+def shift(text, key, decrypt=False, phase=0):
+    # returns the shifted text and the key phase after it; only ASCII letters
+    # move, so str and bytes input give the same result
+    data = _as_array(text)
+    out = bytearray(data)
+    pos, vals, base = _letters(data)
+    shift_lower, shift_upper = _key_shifts(key)
+    if decrypt:
+        shift_lower = (26 - shift_lower) % 26
+        shift_upper = (26 - shift_upper) % 26
+    if phase:
+        shift_lower = np.roll(shift_lower, -phase)
+        shift_upper = np.roll(shift_upper, -phase)
+    if np.array_equal(shift_lower, shift_upper):
+        vals = _tile(vals, shift_lower)
+    else:
+        vals = np.where(base == 97, _tile(vals, shift_lower), _tile(vals, shift_upper))
+    np.frombuffer(out, dtype=np.uint8)[pos] = vals + base
+    phase = (phase + pos.size) % len(key)
+    if isinstance(text, str):
+        return out.decode(), phase
+    return bytes(out), phase
+
+
+def encrypt(text, key):
+    return shift(text, key)[0]
+
+
+def decrypt(text, key):
+    return shift(text, key, decrypt=True)[0]
+
+
+def decrypt_full_key(text, key):
+    # server.decrypt semantics: a key as long as the text is used position by
+    # position, a shorter one letter by letter with "a" once it runs out, and
+    # non-letter key chars count as "a"
+    data = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+    out = bytearray(data)
+    pos, vals, base = _letters(data)
+    k = np.frombuffer(key.lower().encode("ascii"), dtype=np.uint8)
+    if k.size == data.size:
+        k = k[pos]
+    else:
+        k = np.concatenate(
+            [k[: pos.size], np.full(max(pos.size - k.size, 0), 97, np.uint8)]
+        )
+    shifts = np.where((k >= 97) & (k <= 122), k - 97, 0).astype(np.uint8)
+    vals = (vals + 26 - shifts) % 26
+    np.frombuffer(out, dtype=np.uint8)[pos] = vals + base
+    return out.decode("ascii")
@@ -0,0 +1,85 @@
+import struct
+
+# partial key length, ciphertext length; the UTF-8 key and ciphertext follow
+HEADER = struct.Struct("!HQ")
+MAX_FRAME = 64 * 1024 * 1024
+
+
+def recv_into(sock, buf):
+    view = memoryview(buf)
+    got = 0
+    while got < len(view):
+        n = sock.recv_into(view[got:])
+        if n == 0:
+            raise ConnectionError(f"connection closed after {got} of {len(view)} bytes")
+        got += n
+    return buf
+
+
+def pack_message(ciphertxt, key):
+    key = key.encode()
+    ciphertxt = ciphertxt.encode()
+    return HEADER.pack(len(key), len(ciphertxt)) + key + ciphertxt
+
+
+def send_message(sock, ciphertxt, key):
+    sock.sendall(pack_message(ciphertxt, key))
+
+
+def _check_length(cipher_len, max_size):
+    if cipher_len > max_size:
+        raise ValueError(f"frame of {cipher_len} bytes exceeds limit")
+
+
+def recv_message(sock, max_size=MAX_FRAME):
+    key_len, cipher_len = HEADER.unpack(recv_into(sock, bytearray(HEADER.size)))
+    _check_length(cipher_len, max_size)
+    key = recv_into(sock, bytearray(key_len))
+    ciphertxt = recv_into(sock, bytearray(cipher_len))
+    return (key.decode(), ciphertxt.decode())
+
+
+def pack_messages(messages):
+    # within a session a frame with an empty key reuses the previous key, so
+    # the key goes out once per connection unless it changes
+    frames = []
+    last = None
+    for ciphertxt, key in messages:
+        frames.append(pack_message(ciphertxt, "" if key == last else key))
+        last = key
+    return b"".join(frames)
+
+
+def send_messages(sock, messages, batch=64 * 1024):
+    # frames are coalesced into ~batch-sized writes; the session ends when the
+    # sender closes its side
+    pending = bytearray()
+    last = None
+    for ciphertxt, key in messages:
+        pending += pack_message(ciphertxt, "" if key == last else key)
+        last = key
+        if len(pending) >= batch:
+            sock.sendall(pending)
+            pending.clear()
+    if pending:
+        sock.sendall(pending)
+
+
+def recv_messages(sock, max_size=MAX_FRAME):
+    # yields (key, ciphertxt) for each frame until the peer closes the connection
+    key = ""
+    with sock.makefile("rb") as f:
+        while True:
+            header = f.read(HEADER.size)
+            if not header:
+                return
+            if len(header) < HEADER.size:
+                raise ConnectionError("connection closed inside a frame header")
+            key_len, cipher_len = HEADER.unpack(header)
+            _check_length(cipher_len, max_size)
+            body = f.read(key_len + cipher_len)
+            if len(body) < key_len + cipher_len:
+                raise ConnectionError("connection closed inside a frame")
+            if key_len:
+                key = body[:key_len].decode()
+            yield (key, body[key_len:].decode())
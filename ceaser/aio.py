@@ -0,0 +1,71 @@
+import asyncio
+import struct
+
+HEADER = struct.Struct("!I")
+MAX_FRAME = 64 * 1024 * 1024
+
+
+def frame(payload):
+    return HEADER.pack(len(payload)) + payload
+
+
+async def read_frame(reader):
+    (length,) = HEADER.unpack(await reader.readexactly(HEADER.size))
+    if length > MAX_FRAME:
+        raise ValueError(f"frame of {length} bytes exceeds limit")
+    return await reader.readexactly(length)
+
+
+async def start_server(
+    ciphertxt, key, host="127.0.0.1", port=8080, max_connections=1000, timeout=10.0
+):
+    # the frames are identical for every receiver, so encode them once
+    payload = frame(str(key).encode()) + frame(ciphertxt.encode())
+    slots = asyncio.Semaphore(max_connections)
+
+    async def send(writer):
+        async with slots:
+            writer.write(payload)
+            await writer.drain()
+
+    async def handle(reader, writer):
+        # the deadline covers waiting for a slot too, so connections queued
+        # behind a stalled receiver are dropped instead of piling up
+        try:
+            await asyncio.wait_for(send(writer), timeout)
+        except asyncio.TimeoutError:
+            # drop whatever is still buffered for a receiver that stopped reading
+            writer.transport.abort()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, asyncio.CancelledError):
+                pass
+
+    return await asyncio.start_server(
+        handle, host, port, reuse_address=True, backlog=max_connections
+    )
+
+
+async def serve(
+    ciphertxt, key, host="127.0.0.1", port=8080, max_connections=1000, timeout=10.0
+):
+    server = await start_server(ciphertxt, key, host, port, max_connections, timeout)
+    async with server:
+        await server.serve_forever()
+
+
+async def receive(host="127.0.0.1", port=8080, timeout=10.0):
+    reader, writer = await asyncio.wait_for(
+        asyncio.open_connection(host, port), timeout
+    )
+    try:
+        key = await asyncio.wait_for(read_frame(reader), timeout)
+        txt = await asyncio.wait_for(read_frame(reader), timeout)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+    return (key.decode(), txt.decode())
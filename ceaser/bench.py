@@ -0,0 +1,94 @@
+import asyncio
+import sys
+import time
+
+import aio
+import crack
+import shift
+
+
+def legacy_encrypt(str, key):
+    ciphertxt = ""
+    for char in str:
+        if char.islower():
+            ciphertxt += chr(((ord(char) - ord("a") + key) % 26) + ord("a"))
+        else:
+            ciphertxt += chr(((ord(char) - ord("A") + key) % 26) + ord("A"))
+    return ciphertxt
+
+
+def legacy_decrypt(str, key):
+    plain = ""
+    for char in str:
+        if char.islower():
+            plain += chr(((ord(char) - ord("a") - int(key)) % 26) + ord("a"))
+        else:
+            plain += chr(((ord(char) - ord("A") - int(key)) % 26) + ord("A"))
+    return plain
+
+
+def sample(size):
+    text = "The Quick Brown Fox Jumps Over The Lazy Dog "
+    return (text * (size // len(text) + 1))[:size]
+
+
+def timeit(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def report(name, size, elapsed):
+    print(f"{name:<24} {size / elapsed / 1e6:10.2f} MB/s")
+
+
+def bench_translate(size):
+    text = sample(size)
+    data = text.encode()
+    print(f"-- caesar translate, {size} bytes")
+    report("legacy encrypt", size, timeit(legacy_encrypt, text, 3))
+    report("legacy decrypt", size, timeit(legacy_decrypt, text, 3))
+    report("shift.encrypt str", size, timeit(shift.encrypt, text, 3))
+    report("shift.decrypt str", size, timeit(shift.decrypt, text, 3))
+    report("shift.encrypt bytes", size, timeit(shift.encrypt, data, 3))
+    report("shift.decrypt bytes", size, timeit(shift.decrypt, data, 3))
+
+
+async def _connections(count, concurrency, payload):
+    server = await aio.start_server(payload, 3, port=0, max_connections=concurrency)
+    port = server.sockets[0].getsockname()[1]
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with gate:
+            key, txt = await aio.receive(port=port)
+            assert txt == payload
+
+    async with server:
+        start = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(count)))
+        return time.perf_counter() - start
+
+
+def bench_connections(count=5000, concurrency=500, size=4096):
+    payload = shift.encrypt(sample(size), 3)
+    elapsed = asyncio.run(_connections(count, concurrency, payload))
+    print(f"-- async serve, {count} receivers, {concurrency} concurrent, {size} bytes")
+    print(f"{'connections/s':<24} {count / elapsed:10.0f}")
+
+
+def bench_crack(count=10000, size=256):
+    text = sample(size * 2)
+    ciphertexts = [
+        shift.encrypt(text[i % size : i % size + size], i) for i in range(count)
+    ]
+    elapsed = timeit(crack.crack_batch, ciphertexts)
+    print(f"-- crack_batch, {count} ciphertexts of {size} bytes")
+    print(f"{'ciphertexts/s':<24} {count / elapsed:10.0f}")
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 4 * 1024 * 1024
+    bench_translate(size)
+    bench_connections()
+    bench_crack()
@@ -1,14 +1,13 @@
+import asyncio
 import socket
+import sys
+
+import aio
+import shift
 
 
 def encrypt(str, key):
-    ciphertxt = ""
-    for char in str:
-        if char.islower():
-            ciphertxt += chr(((ord(char) - ord("a") + key) % 26) + ord("a"))
-        else:
-            ciphertxt += chr(((ord(char) - ord("A") + key) % 26) + ord("A"))
-    return ciphertxt
+    return shift.encrypt(str, key)
 
 
 def transmit(str, key):
@@ -24,8 +23,15 @@ def transmit(str, key):
         c.close()
 
 
+def transmit_async(str, key, max_connections=1000, timeout=10.0):
+    asyncio.run(aio.serve(str, key, max_connections=max_connections, timeout=timeout))
+
+
 if __name__ == "__main__":
     plaintxt = input("Enter the string to encrypt: ")
     key = int(input("Enter the shift value: "))
 
-    transmit(encrypt(plaintxt, key), str(key))
+    if "--async" in sys.argv:
+        transmit_async(encrypt(plaintxt, key), str(key))
+    else:
+        transmit(encrypt(plaintxt, key), str(key))
@@ -0,0 +1,83 @@
+import numpy as np
+
+import shift
+
+# relative frequencies of a-z in English text
+ENGLISH = np.array(
+    [
+        8.167, 1.492, 2.782, 4.253, 12.702, 2.228, 2.015, 6.094, 6.966,
+        0.153, 0.772, 4.025, 2.406, 6.749, 7.507, 1.929, 0.095, 5.987,
+        6.327, 9.056, 2.758, 0.978, 2.360, 0.150, 1.974, 0.074,
+    ]
+)  # fmt: skip
+ENGLISH = ENGLISH / ENGLISH.sum()
+
+SHIFTS = np.arange(26, dtype=np.uint8)[:, None]
+# ROTATE[k, j] is the ciphertext letter that becomes j when decrypted with shift k
+ROTATE = (np.arange(26)[None, :] + np.arange(26)[:, None]) % 26
+
+
+def _as_array(data):
+    if isinstance(data, str):
+        data = data.encode()
+    return np.frombuffer(data, dtype=np.uint8)
+
+
+def _letters(arr):
+    return ((arr >= 97) & (arr <= 122)) | ((arr >= 65) & (arr <= 90))
+
+
+def shift_matrix(data):
+    # row k holds the buffer decrypted with shift k, non-letters untouched
+    arr = _as_array(data)
+    letters = _letters(arr)
+    base = np.where(arr >= 97, 97, 65).astype(np.uint8)[letters]
+    vals = arr[letters] - base
+    out = np.repeat(arr[None, :], 26, axis=0)
+    out[:, letters] = (vals + 26 - SHIFTS) % 26 + base
+    return out
+
+
+def chi_squared(counts):
+    total = np.maximum(counts.sum(axis=-1, keepdims=True), 1)
+    expected = total * ENGLISH
+    return (((counts - expected) ** 2) / expected).sum(axis=-1)
+
+
+def score(data):
+    arr = _as_array(data)
+    vals = (arr[_letters(arr)] | 0x20) - 97
+    counts = np.bincount(vals, minlength=26)
+    return chi_squared(counts[ROTATE])
+
+
+def crack(ciphertxt, top=3):
+    scores = score(ciphertxt)
+    ranked = np.argsort(scores)[:top]
+    rows = shift_matrix(ciphertxt)[ranked]
+    results = []
+    for k, row in zip(ranked, rows):
+        plain = row.tobytes()
+        if isinstance(ciphertxt, str):
+            plain = plain.decode()
+        results.append((int(k), float(scores[k]), plain))
+    return results
+
+
+def crack_batch(ciphertexts):
+    # returns (shifts ranked best-first, chi-squared scores), both len(ciphertexts) x 26
+    bufs = [c.encode() if isinstance(c, str) else bytes(c) for c in ciphertexts]
+    arr = np.frombuffer(b"".join(bufs), dtype=np.uint8)
+    ids = np.repeat(np.arange(len(bufs)), [len(b) for b in bufs])
+    letters = _letters(arr)
+    vals = (arr[letters] | 0x20) - 97
+    counts = np.bincount(ids[letters] * 26 + vals, minlength=len(bufs) * 26).reshape(
+        len(bufs), 26
+    )
+    scores = chi_squared(counts[:, ROTATE])
+    return np.argsort(scores, axis=1), scores
+
+
+def best_plaintexts(ciphertexts):
+    ranked, _ = crack_batch(ciphertexts)
+    return [shift.decrypt(c, int(k)) for c, k in zip(ciphertexts, ranked[:, 0])]
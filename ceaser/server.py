@@ -1,14 +1,13 @@
+import asyncio
 import socket
+import sys
+
+import aio
+import shift
 
 
 def decrypt(str, key):
-    plain = ""
-    for char in str:
-        if char.islower():
-            plain += chr(((ord(char) - ord("a") - int(key)) % 26) + ord("a"))
-        else:
-            plain += chr(((ord(char) - ord("A") - int(key)) % 26) + ord("A"))
-    return plain
+    return shift.decrypt(str, key)
 
 
 def receive():
@@ -21,8 +20,15 @@ def receive():
     return (key, txt)
 
 
+def receive_async(timeout=10.0):
+    return asyncio.run(aio.receive(timeout=timeout))
+
+
 if __name__ == "__main__":
-    key, ciphertxt = receive()
+    if "--async" in sys.argv:
+        key, ciphertxt = receive_async()
+    else:
+        key, ciphertxt = receive()
     plaintxt = decrypt(ciphertxt, int(key))
     print("Received: ", ciphertxt)
     print("Decrypted: ", plaintxt)
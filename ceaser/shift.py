@@ -0,0 +1,39 @@
+import string
+
+LOWER = string.ascii_lowercase
+UPPER = string.ascii_uppercase
+
+
+def _rotate(alphabet, key):
+    return alphabet[key:] + alphabet[:key]
+
+
+# one translation table per shift, built once at import time
+STR_TABLES = [
+    str.maketrans(LOWER + UPPER, _rotate(LOWER, k) + _rotate(UPPER, k))
+    for k in range(26)
+]
+BYTES_TABLES = [
+    bytes.maketrans(
+        (LOWER + UPPER).encode(), (_rotate(LOWER, k) + _rotate(UPPER, k)).encode()
+    )
+    for k in range(26)
+]
+
+
+def shift(data, key):
+    # letters are rotated, everything else (digits, punctuation, ...) passes through
+    key = int(key) % 26
+    if isinstance(data, str):
+        return data.translate(STR_TABLES[key])
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return data.translate(BYTES_TABLES[key])
+
+
+def encrypt(data, key):
+    return shift(data, key)
+
+
+def decrypt(data, key):
+    return shift(data, -int(key))
@@ -0,0 +1,55 @@
+import sys
+
+from client import encrypt
+from server import decrypt
+
+CHUNK_SIZE = 1 << 20
+
+
+def iter_chunks(source, size=CHUNK_SIZE):
+    # file-like objects are read in fixed-size chunks, anything else is
+    # treated as an iterable of bytes chunks and passed through
+    if not hasattr(source, "read"):
+        yield from source
+        return
+    while True:
+        chunk = source.read(size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def encrypt_stream(source, key, size=CHUNK_SIZE):
+    for chunk in iter_chunks(source, size):
+        yield encrypt(chunk, key)
+
+
+def decrypt_stream(source, key, size=CHUNK_SIZE):
+    for chunk in iter_chunks(source, size):
+        yield decrypt(chunk, key)
+
+
+def pipe(mode, key, src, dst, size=CHUNK_SIZE):
+    stream = encrypt_stream if mode == "encrypt" else decrypt_stream
+    total = 0
+    for chunk in stream(src, key, size):
+        dst.write(chunk)
+        total += len(chunk)
+    dst.flush()
+    return total
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3 or sys.argv[1] not in ("encrypt", "decrypt"):
+        print("Usage: stream.py encrypt|decrypt SHIFT [INPUT] [OUTPUT]")
+        sys.exit(2)
+    mode, key = sys.argv[1], int(sys.argv[2])
+    src = open(sys.argv[3], "rb") if len(sys.argv) > 3 else sys.stdin.buffer
+    dst = open(sys.argv[4], "wb") if len(sys.argv) > 4 else sys.stdout.buffer
+    try:
+        pipe(mode, key, src, dst)
+    finally:
+        if src is not sys.stdin.buffer:
+            src.close()
+        if dst is not sys.stdout.buffer:
+            dst.close()
@@ -0,0 +1,182 @@
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+import client
+import hillkey
+import modinv
+import server
+import solve
+
+SIZES = [1024, 1024 * 1024, 10 * 1024 * 1024, 100 * 1024 * 1024]
+# the per-trigraph loop runs at well under 1 MB/s, so it is only timed up to here
+LEGACY_LIMIT = 1024 * 1024
+KEY = "gybnqkurp"
+
+
+def legacy_encrypt(plaintxt, key):
+    K = np.array(server.matricize(key))
+
+    plaintxt = list(plaintxt.lower())
+    while len(plaintxt) % 3 != 0:
+        plaintxt.append("x")
+
+    P_nums = []
+    for char in plaintxt:
+        P_nums.append(ord(char) - ord("a"))
+
+    ciphertxt = ""
+    for i in range(0, len(P_nums), 3):
+        P_row = np.array(P_nums[i : i + 3]).reshape(1, 3)
+        C_row = (P_row @ K) % 26
+        for num in C_row.flatten():
+            ciphertxt += chr(int(num) + ord("a"))
+    return ciphertxt
+
+
+def sample(size):
+    text = "thequickbrownfoxjumpsoverthelazydog"
+    return (text * (size // len(text) + 1))[:size]
+
+
+def timeit(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def report(name, size, elapsed):
+    print(f"{name:<28} {size / elapsed / 1e6:10.2f} MB/s")
+
+
+def bench_matmul(sizes):
+    for size in sizes:
+        text = sample(size)
+        print(f"-- hill 3x3, {size} bytes")
+        if size <= LEGACY_LIMIT:
+            report("legacy encrypt", size, timeit(legacy_encrypt, text, KEY))
+        else:
+            print(f"{'legacy encrypt':<28} {'skipped':>10}")
+        report("server.encrypt", size, timeit(server.encrypt, text, KEY))
+        ciphertxt = server.encrypt(text, KEY)
+        report("client.decrypt", len(ciphertxt), timeit(client.decrypt, ciphertxt, KEY))
+        messages = [text[i : i + 1024] for i in range(0, size, 1024)]
+        report(
+            "server.encrypt_batch (1 KB)",
+            size,
+            timeit(server.encrypt_batch, messages, KEY),
+        )
+
+
+def legacy_inverse(key):
+    from sympy import Matrix
+
+    K = np.array(server.matricize(key))
+    det = int(np.round(np.linalg.det(K))) % 26
+    inv = det
+    for i in range(1, 26):
+        if (det * i) % 26 == 1:
+            inv = i
+            break
+    return np.array(Matrix(K).adjugate().tolist()) * inv % 26
+
+
+def _per_call(fn, *args, count=2000):
+    start = time.perf_counter()
+    for _ in range(count):
+        fn(*args)
+    return (time.perf_counter() - start) / count
+
+
+def bench_inverse():
+    matrix = server.matricize(KEY)
+    print("-- key inversion, per call")
+    print(f"{'sympy adjugate':<28} {_per_call(legacy_inverse, KEY) * 1e6:10.1f} us")
+    print(
+        f"{'modinv.inverse_mod26':<28} {_per_call(modinv.inverse_mod26, matrix) * 1e6:10.1f} us"
+    )
+    hillkey.load.cache_clear()
+    print(
+        f"{'client.decrypt (cached)':<28} {_per_call(client.decrypt, 'byoojoopo', KEY) * 1e6:10.1f} us"
+    )
+    print(f"{'cache':<28} {client.cache_stats()}")
+
+
+def random_key(size, rng):
+    while True:
+        key = (
+            (rng.integers(0, 26, size * size) + 97).astype(np.uint8).tobytes().decode()
+        )
+        try:
+            return hillkey.HillKey(key)
+        except ValueError:
+            continue
+
+
+def bench_block_sizes(size=10 * 1024 * 1024):
+    rng = np.random.default_rng(0)
+    text = sample(size)
+    print(f"-- hill n x n, {size} bytes")
+    for n in range(hillkey.MIN_SIZE, hillkey.MAX_SIZE + 1):
+        K = random_key(n, rng)
+        ciphertxt = K.encrypt(text)
+        enc = timeit(K.encrypt, text)
+        dec = timeit(K.decrypt, ciphertxt)
+        print(
+            f"{f'{n}x{n}':<28} {size / enc / 1e6:10.2f} MB/s enc {size / dec / 1e6:10.2f} MB/s dec"
+        )
+
+
+def bench_solve(count=2000, size=3, blocks_per_session=8):
+    rng = np.random.default_rng(0)
+    sessions = []
+    for _ in range(count):
+        K = random_key(size, rng)
+        letters = rng.integers(0, 26, size * blocks_per_session) + 97
+        plaintxt = letters.astype(np.uint8).tobytes().decode()
+        sessions.append((plaintxt, K.encrypt(plaintxt)))
+    print(f"-- known-plaintext solve, {count} sessions, {size}x{size}")
+    for name, workers in (("serial", 1), ("process pool", None)):
+        start = time.perf_counter()
+        keys = solve.recover_batch(sessions, size, workers=workers)
+        elapsed = time.perf_counter() - start
+        found = sum(k is not None for k in keys)
+        print(f"{name:<28} {count / elapsed:10.0f} solves/s  {found}/{count} keys")
+
+
+HEAVY = ("numpy", "sympy")
+
+
+def bench_import(modules=("client", "server")):
+    # python -X importtime writes "import time: self | cumulative | name" to stderr
+    print("-- import time (python -X importtime)")
+    here = os.path.dirname(os.path.abspath(__file__))
+    for module in modules:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=here,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        cumulative = {}
+        for line in result.stderr.splitlines():
+            if line.startswith("import time:") and "|" in line:
+                _, total, name = line.split("|")
+                if total.strip().isdigit():
+                    cumulative[name.strip()] = int(total)
+        heavy = [m for m in HEAVY if m in cumulative]
+        status = f"REGRESSION: imports {', '.join(heavy)}" if heavy else "ok"
+        print(f"{module:<28} {cumulative[module]:10d} us  {status}")
+
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or SIZES
+    bench_matmul(sizes)
+    bench_inverse()
+    bench_block_sizes()
+    bench_solve()
+    bench_import()
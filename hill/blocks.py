@@ -0,0 +1,38 @@
+# NumPy is imported inside the functions so importing the hill modules stays
+# cheap for short-lived workers; after the first call it is a sys.modules lookup
+
+
+def to_blocks(text, width, pad=None):
+    # letters as 0-25 in rows of `width`; utf-32 keeps ord() exact for every char
+    import numpy as np
+
+    nums = np.frombuffer(text.lower().encode("utf-32-le"), dtype=np.uint32)
+    nums = nums.astype(np.int64) - ord("a")
+    if pad is not None and nums.size % width:
+        nums = np.concatenate(
+            [nums, np.full(width - nums.size % width, ord(pad) - ord("a"))]
+        )
+    return nums.reshape(-1, width)
+
+
+def from_blocks(blocks):
+    import numpy as np
+
+    return (blocks.astype(np.uint8) + ord("a")).tobytes().decode("ascii")
+
+
+def stack(texts, width, pad=None):
+    import numpy as np
+
+    # all messages in one matrix; rows offsets[i]:offsets[i + 1] belong to message i
+    parts = [to_blocks(t, width, pad) for t in texts]
+    offsets = np.zeros(len(parts) + 1, dtype=np.int64)
+    np.cumsum([len(p) for p in parts], out=offsets[1:])
+    return np.concatenate(parts) if parts else np.zeros((0, width), np.int64), offsets
+
+
+def unstack(blocks, offsets):
+    text = from_blocks(blocks)
+    width = blocks.shape[1]
+    bounds = (offsets * width).tolist()
+    return [text[a:b] for a, b in zip(bounds, bounds[1:])]
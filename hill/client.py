@@ -1,7 +1,7 @@
 import socket
 
-import numpy as np
-from sympy import Matrix
+import hillkey
+from hillkey import matricize
 
 
 def eeuclid(a: int, b: int) -> tuple:
@@ -26,49 +26,31 @@ def eeuclid(a: int, b: int) -> tuple:
     return (x2, y2)
 
 
-def matricize(key):
-    ckey = []
-    key = list(key)
-    for i in range(len(key)):
-        key[i] = ord(key[i]) - ord("a")
+def inverse_key(key):
+    try:
+        return hillkey.load(key).inverse_array
+    except ValueError:
+        return None
 
-    while len(key) % 3 != 0:
-        key.append(23)
 
-    for i in range(0, len(key), 3):
-        ckey.append(key[i : i + 3])
-    return ckey
+def cache_stats():
+    return hillkey.cache_stats()
 
 
 def decrypt(ciphertxt, key):
-    K = np.array(matricize(key))
-
-    det = int(np.round(np.linalg.det(K))) % 26
-    if det == 0:
+    try:
+        K = hillkey.load(key)
+    except ValueError:
         return "Error: Key not invertible"
+    return K.decrypt(ciphertxt)
 
-    inv = det
-    for i in range(1, 26):
-        if (det * i) % 26 == 1:
-            inv = i
-            break
 
-    Ks = Matrix(K)
-    Ks = Ks.adjugate()
-    K_inv = np.array(Ks.tolist()) * inv % 26
-
-    ciphertxt = list(ciphertxt.lower())
-    C_nums = []
-    for char in ciphertxt:
-        C_nums.append(ord(char) - ord("a"))
-
-    plaintxt = ""
-    for i in range(0, len(C_nums), 3):
-        C_row = np.array(C_nums[i : i + 3]).reshape(1, 3)
-        P_row = (C_row @ K_inv) % 26
-        for num in P_row.flatten():
-            plaintxt += chr(int(num) + ord("a"))
-    return plaintxt
+def decrypt_batch(ciphertxts, key):
+    try:
+        K = hillkey.load(key)
+    except ValueError:
+        return ["Error: Key not invertible"] * len(ciphertxts)
+    return K.decrypt_batch(ciphertxts)
 
 
 def receive():
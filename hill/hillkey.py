@@ -0,0 +1,83 @@
+import functools
+import math
+
+import blocks
+import modinv
+
+MIN_SIZE = 2
+MAX_SIZE = 8
+
+
+def matricize(key, size=None):
+    # rows of `size` letter values; size defaults to the smallest n with
+    # n * n >= len(key), and short keys are padded with 23 ("x") as before
+    if size is None:
+        size = math.isqrt(max(len(key) - 1, 0)) + 1
+    nums = [ord(c) - ord("a") for c in key]
+    nums += [23] * (size * size - len(nums))
+    return [nums[i : i + size] for i in range(0, len(nums), size)]
+
+
+class HillKey:
+    def __init__(self, key, size=None):
+        if isinstance(key, str):
+            key = key.lower()
+            if not key.isascii() or not key.isalpha():
+                raise ValueError("key must consist of the letters a-z")
+            matrix = matricize(key, size)
+        else:
+            matrix = [[int(x) % 26 for x in row] for row in key]
+        n = len(matrix)
+        if any(len(row) != n for row in matrix):
+            raise ValueError("key matrix must be square")
+        if not MIN_SIZE <= n <= MAX_SIZE:
+            raise ValueError(f"block size must be {MIN_SIZE}-{MAX_SIZE}, got {n}")
+        inverse = modinv.inverse_mod26(matrix)
+        if inverse is None:
+            raise ValueError("key matrix is not invertible mod 26")
+        self.size = n
+        self.matrix = matrix
+        self.inverse = inverse
+
+    @functools.cached_property
+    def forward_array(self):
+        import numpy as np
+
+        K = np.array(self.matrix, dtype=np.int64)
+        K.flags.writeable = False
+        return K
+
+    @functools.cached_property
+    def inverse_array(self):
+        import numpy as np
+
+        K_inv = np.array(self.inverse, dtype=np.int64)
+        K_inv.flags.writeable = False
+        return K_inv
+
+    def encrypt(self, plaintxt, pad="x"):
+        P = blocks.to_blocks(plaintxt, self.size, pad=pad)
+        return blocks.from_blocks((P @ self.forward_array) % 26)
+
+    def decrypt(self, ciphertxt):
+        C = blocks.to_blocks(ciphertxt, self.size)
+        return blocks.from_blocks((C @ self.inverse_array) % 26)
+
+    def encrypt_batch(self, plaintxts, pad="x"):
+        P, offsets = blocks.stack(plaintxts, self.size, pad=pad)
+        return blocks.unstack((P @ self.forward_array) % 26, offsets)
+
+    def decrypt_batch(self, ciphertxts):
+        C, offsets = blocks.stack(ciphertxts, self.size)
+        return blocks.unstack((C @ self.inverse_array) % 26, offsets)
+
+
+@functools.lru_cache(maxsize=256)
+def load(key):
+    # compiled keys are cached by key string; invalid keys raise every time
+    return HillKey(key)
+
+
+def cache_stats():
+    info = load.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize}
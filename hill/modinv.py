@@ -0,0 +1,31 @@
+def _inverse_mod_prime(matrix, p):
+    # Gauss-Jordan elimination over GF(p) on plain ints
+    n = len(matrix)
+    rows = [
+        [x % p for x in row] + [int(i == j) for j in range(n)]
+        for i, row in enumerate(matrix)
+    ]
+    for col in range(n):
+        pivot = next((r for r in range(col, n) if rows[r][col]), None)
+        if pivot is None:
+            return None
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        inv = pow(rows[col][col], -1, p)
+        rows[col] = [x * inv % p for x in rows[col]]
+        for r in range(n):
+            if r != col and rows[r][col]:
+                f = rows[r][col]
+                rows[r] = [(x - f * y) % p for x, y in zip(rows[r], rows[col])]
+    return [row[n:] for row in rows]
+
+
+def inverse_mod26(matrix):
+    # 26 = 2 * 13, so invert over GF(2) and GF(13) and recombine with the CRT:
+    # 13 is 1 mod 2 and 0 mod 13, 14 is 0 mod 2 and 1 mod 13
+    if not matrix or any(len(row) != len(matrix) for row in matrix):
+        return None
+    a = _inverse_mod_prime(matrix, 2)
+    b = _inverse_mod_prime(matrix, 13)
+    if a is None or b is None:
+        return None
+    return [[(13 * x + 14 * y) % 26 for x, y in zip(ra, rb)] for ra, rb in zip(a, b)]
@@ -1,40 +1,17 @@
 import socket
 
-import numpy as np
-
-
-def matricize(key):
-    ckey = []
-    key = list(key)
-    for i in range(len(key)):
-        key[i] = ord(key[i]) - ord("a")
-
-    while len(key) % 3 != 0:
-        key.append(23)
-
-    for i in range(0, len(key), 3):
-        ckey.append(key[i : i + 3])
-    return ckey
+import hillkey
+from hillkey import matricize
 
 
 def encrypt(plaintxt, key):
-    K = np.array(matricize(key))
-
-    plaintxt = list(plaintxt.lower())
-    while len(plaintxt) % 3 != 0:
-        plaintxt.append("x")
+    # raises ValueError up front for keys the receiver could not invert
+    return hillkey.load(key).encrypt(plaintxt)
 
-    P_nums = []
-    for char in plaintxt:
-        P_nums.append(ord(char) - ord("a"))
 
-    ciphertxt = ""
-    for i in range(0, len(P_nums), 3):
-        P_row = np.array(P_nums[i : i + 3]).reshape(1, 3)
-        C_row = (P_row @ K) % 26
-        for num in C_row.flatten():
-            ciphertxt += chr(int(num) + ord("a"))
-    return ciphertxt
+def encrypt_batch(plaintxts, key):
+    # every message under the same key goes through a single matrix multiply
+    return hillkey.load(key).encrypt_batch(plaintxts)
 
 
 def transmit(ciphertxt, key):
@@ -0,0 +1,67 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import blocks
+
+
+def _solve_mod_prime(P, C, p):
+    # row-reduce [P | C] over GF(p); with full column rank the top n rows of
+    # the right-hand side are K mod p
+    import numpy as np
+
+    n = P.shape[1]
+    A = np.concatenate([P, C], axis=1) % p
+    for col in range(n):
+        candidates = np.flatnonzero(A[col:, col])
+        if candidates.size == 0:
+            return None
+        pivot = col + candidates[0]
+        A[[col, pivot]] = A[[pivot, col]]
+        A[col] = A[col] * pow(int(A[col, col]), -1, p) % p
+        factors = A[:, col].copy()
+        factors[col] = 0
+        A = (A - np.outer(factors, A[col])) % p
+    return A[:n, n:]
+
+
+def solve(P, C):
+    # K with P @ K == C (mod 26) from row-aligned known blocks, or None when the
+    # pairs do not pin K down. Pivots that are not units mod 26 are avoided by
+    # eliminating mod 2 and mod 13 separately and recombining with the CRT.
+    import numpy as np
+
+    P = np.asarray(P, dtype=np.int64) % 26
+    C = np.asarray(C, dtype=np.int64) % 26
+    k2 = _solve_mod_prime(P, C, 2)
+    k13 = _solve_mod_prime(P, C, 13)
+    if k2 is None or k13 is None:
+        return None
+    K = (13 * k2 + 14 * k13) % 26
+    if not ((P @ K) % 26 == C).all():
+        return None
+    return K
+
+
+def recover_key(plaintxt, ciphertxt, size):
+    # the plaintext is padded with "x" exactly like HillKey.encrypt does
+    P = blocks.to_blocks(plaintxt, size, pad="x")
+    C = blocks.to_blocks(ciphertxt, size)
+    if P.shape != C.shape:
+        raise ValueError("plaintext and ciphertext cover a different number of blocks")
+    K = solve(P, C)
+    if K is None:
+        return None
+    return blocks.from_blocks(K)
+
+
+def _recover(args):
+    return recover_key(*args)
+
+
+def recover_batch(sessions, size, workers=None):
+    # sessions is a sequence of (plaintxt, ciphertxt) pairs, one key each
+    jobs = [(p, c, size) for p, c in sessions]
+    if workers == 1:
+        return [_recover(job) for job in jobs]
+    chunksize = max(1, len(jobs) // ((workers or 8) * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_recover, jobs, chunksize=chunksize))
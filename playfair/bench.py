@@ -0,0 +1,205 @@
+import random
+import socket
+import string
+import sys
+import threading
+import time
+
+import client
+import playkey
+import server
+import wire
+from playkey import PlayfairKey
+
+KEY = "monarchy"
+# the grid scan runs at well under 1 MB/s, so it is only timed up to here
+LEGACY_LIMIT = 1024 * 1024
+
+
+def legacy_encrypt(plaintxt, key):
+    bigram = server.genbigram(plaintxt)
+    subbed = ""
+    for sec in bigram:
+        r1, c1 = server.findrc(sec[0], key)
+        r2, c2 = server.findrc(sec[1], key)
+
+        if r1 == r2:
+            subbed += key[r1][(c1 + 1) % 5]
+            subbed += key[r1][(c2 + 1) % 5]
+        elif c1 == c2:
+            subbed += key[(r1 + 1) % 5][c1]
+            subbed += key[(r2 + 1) % 5][c2]
+        else:
+            subbed += key[r1][c2]
+            subbed += key[r2][c1]
+    return subbed
+
+
+def sample(size):
+    text = "wemeetattheoldbridgeatnoonbringthedocuments"
+    return (text * (size // len(text) + 1))[:size]
+
+
+def timeit(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def report(name, size, elapsed):
+    print(f"{name:<28} {size / elapsed / 1e6:10.2f} MB/s")
+
+
+def bench_table(size):
+    text = sample(size)
+    matrix = server.keygen(KEY)
+    print(f"-- playfair, {size} bytes")
+    legacy = min(size, LEGACY_LIMIT)
+    report("grid scan (findrc)", legacy, timeit(legacy_encrypt, text[:legacy], matrix))
+    print(f"{'PlayfairKey setup':<28} {timeit(PlayfairKey, matrix) * 1e6:10.1f} us")
+    key = PlayfairKey(matrix)
+    report("bigram table", size, timeit(key.encrypt, text))
+
+
+def verify_bulk(trials=2000, seed=0):
+    # differential check: the NumPy path must match the pair-by-pair path and
+    # the original grid-scan encrypt on random keys and texts
+    rng = random.Random(seed)
+    alphabet = string.ascii_lowercase + "aabbxxjJ. "
+    for _ in range(trials):
+        passphrase = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        matrix = playkey.keygen(passphrase)
+        key = PlayfairKey(matrix)
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 600)))
+        expected = legacy_encrypt(text, matrix)
+        assert key.encrypt(text) == expected, (passphrase, text)
+        assert key.encrypt_bulk(text) == expected, (passphrase, text)
+        assert server.encrypt(text, matrix) == expected, (passphrase, text)
+        assert key.decrypt_bulk(text) == key.decrypt(text), (passphrase, text)
+        assert client.decrypt(text, matrix) == key.decrypt(text), (passphrase, text)
+    print(f"-- bulk path matches encrypt/decrypt on {trials} random cases")
+
+
+def bench_bulk(size):
+    text = sample(size)
+    key = playkey.compile_key(KEY)
+    ciphertxt = key.encrypt_bulk(text)
+    print(f"-- playfair bulk, {size} bytes")
+    report("encrypt_bulk", size, timeit(key.encrypt_bulk, text))
+    report("decrypt_bulk", size, timeit(key.decrypt_bulk, ciphertxt))
+
+
+def bench_cache(sessions=20000, distinct=50):
+    passphrases = [f"{KEY}{i}" for i in range(distinct)]
+    print(f"-- key setup, {sessions} sessions over {distinct} passphrases")
+    start = time.perf_counter()
+    for i in range(sessions // 10):
+        PlayfairKey(playkey.keygen(passphrases[i % distinct]))
+    uncached = (time.perf_counter() - start) / (sessions // 10)
+    cache = playkey.KeyCache(maxsize=distinct)
+    start = time.perf_counter()
+    for i in range(sessions):
+        cache.get(passphrases[i % distinct])
+    cached = (time.perf_counter() - start) / sessions
+    print(f"{'compile every session':<28} {uncached * 1e6:10.1f} us")
+    print(f"{'KeyCache':<28} {cached * 1e6:10.1f} us  {cache.stats()}")
+
+
+def _listener():
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(128)
+    return listener
+
+
+def legacy_frame(ciphertxt, matrix):
+    key_str = "|".join([",".join(row) for row in matrix])
+    return (key_str + "||" + ciphertxt).encode()
+
+
+def _legacy(ciphertexts, matrix):
+    # server.transmit / client.receive: one connection, one serialized matrix
+    # and a single recv(1024) per message
+    listener = _listener()
+
+    def serve():
+        for ciphertxt in ciphertexts:
+            c, addr = listener.accept()
+            try:
+                c.sendall(legacy_frame(ciphertxt, matrix))
+            finally:
+                c.close()
+
+    thread = threading.Thread(target=serve)
+    thread.start()
+    for _ in ciphertexts:
+        s = socket.create_connection(listener.getsockname())
+        data = s.recv(1024).decode()
+        s.close()
+        key_data, ciphertxt = data.split("||")
+        key = [row.split(",") for row in key_data.split("|")]
+        client.decrypt(ciphertxt, key)
+    thread.join()
+    listener.close()
+
+
+def _sessions(ciphertexts, matrix, clients=1):
+    # each client opens one session against server.serve_session and receives
+    # its share of the messages
+    listener = _listener()
+    share = len(ciphertexts) // clients
+    payload = wire.pack_session(ciphertexts[:share], matrix)
+
+    def serve():
+        try:
+            server.serve_session(listener, payload, max_connections=clients)
+        except OSError:
+            # the listener was shut down once every receiver finished
+            pass
+
+    received = []
+
+    def receive():
+        s = socket.create_connection(listener.getsockname())
+        try:
+            received.append(sum(1 for _ in client.decrypt_session(s)))
+        finally:
+            s.close()
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    receivers = [threading.Thread(target=receive) for _ in range(clients)]
+    for t in receivers:
+        t.start()
+    for t in receivers:
+        t.join()
+    listener.shutdown(socket.SHUT_RDWR)
+    thread.join()
+    listener.close()
+    assert sum(received) == share * clients
+
+
+def bench_transport(count=4000, size=200):
+    # size stays under the legacy recv(1024) so the old path is not truncated
+    matrix = playkey.keygen(KEY)
+    ciphertexts = [server.encrypt(sample(size), matrix)] * count
+    legacy_bytes = len(legacy_frame(ciphertexts[0], matrix))
+    session_bytes = len(wire.pack_session(ciphertexts, matrix)) / count
+    print(f"-- transport, {count} messages of {size} bytes")
+    print(f"{'bytes/message legacy':<28} {legacy_bytes:10d}")
+    print(f"{'bytes/message session':<28} {session_bytes:10.1f}")
+    elapsed = timeit(_legacy, ciphertexts, matrix)
+    print(f"{'connection per message':<28} {count / elapsed:10.0f} msg/s")
+    for clients in (1, 4):
+        elapsed = timeit(_sessions, ciphertexts, matrix, clients)
+        name = f"session, {clients} client(s)"
+        print(f"{name:<28} {count / elapsed:10.0f} msg/s")
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10 * 1024 * 1024
+    bench_table(size)
+    bench_cache()
+    verify_bulk()
+    bench_bulk(size)
+    bench_transport()
@@ -1,4 +1,8 @@
 import socket
+import sys
+
+import playkey
+import wire
 
 
 def genbigram(plaintxt):
@@ -32,22 +36,10 @@ def findrc(char, key):
 
 
 def decrypt(ciphertxt, key):
-    bigram = genbigram(ciphertxt)
-    subbed = ""
-    for sec in bigram:
-        r1, c1 = findrc(sec[0], key)
-        r2, c2 = findrc(sec[1], key)
-
-        if r1 == r2:
-            subbed += key[r1][(c1 - 1 + 5) % 5]
-            subbed += key[r1][(c2 - 1 + 5) % 5]
-        elif c1 == c2:
-            subbed += key[(r1 - 1 + 5) % 5][c1]
-            subbed += key[(r2 - 1 + 5) % 5][c2]
-        else:
-            subbed += key[r1][c2]
-            subbed += key[r2][c1]
-    return subbed
+    key = playkey.lookup(key)
+    if len(ciphertxt) >= playkey.BULK_THRESHOLD:
+        return key.decrypt_bulk(ciphertxt)
+    return key.decrypt(ciphertxt)
 
 
 def receive():
@@ -66,11 +58,35 @@ def receive():
     return ciphertext, key
 
 
+def decrypt_session(sock):
+    # the compiled key is fetched from the cache once per KEY frame
+    grid, key = None, None
+    for frame_grid, ciphertxt in wire.recv_session(sock):
+        if frame_grid is not grid:
+            grid, key = frame_grid, playkey.lookup(frame_grid)
+        yield (ciphertxt, decrypt(ciphertxt, key))
+
+
+def receive_session():
+    s = socket.socket()
+    port = 8080
+    s.connect(("127.0.0.1", port))
+    try:
+        yield from decrypt_session(s)
+    finally:
+        s.close()
+
+
 if __name__ == "__main__":
-    ciphertxt, key = receive()
-    plaintxt = decrypt(ciphertxt, key)
-    print("Key Matrix:")
-    for row in key:
-        print(row)
-    print(f"Received ciphertext: {ciphertxt}")
-    print(f"Decrypted plaintext: {plaintxt}")
+    if "--session" in sys.argv:
+        for ciphertxt, plaintxt in receive_session():
+            print(f"Received ciphertext: {ciphertxt}")
+            print(f"Decrypted plaintext: {plaintxt}")
+    else:
+        ciphertxt, key = receive()
+        plaintxt = decrypt(ciphertxt, key)
+        print("Key Matrix:")
+        for row in key:
+            print(row)
+        print(f"Received ciphertext: {ciphertxt}")
+        print(f"Decrypted plaintext: {plaintxt}")
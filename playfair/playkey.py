@@ -0,0 +1,219 @@
+import functools
+import threading
+from collections import OrderedDict
+
+# 25 grid cells plus one class for characters that are not in the grid
+OTHER = 25
+CLASSES = 26
+# below this length the per-pair lookup beats the NumPy setup cost
+BULK_THRESHOLD = 256
+
+
+def remcommon(st):
+    # first occurrence of every character, in order
+    return "".join(dict.fromkeys(st))
+
+
+def keygen(key):
+    temp = ""
+    if "i" in key:
+        temp = "j"
+    elif "j" in key:
+        temp = "i"
+    else:
+        temp = "i"
+    keychar = remcommon(key.lower())
+    matval = remcommon(keychar.lower() + "abcdefgh" + temp + "klmnopqrstuvwxyz")
+    return [list(matval[i : i + 5]) for i in range(0, 25, 5)]
+
+
+def pairs(text):
+    # same split as genbigram: pad odd input with "x" first, then break doubled
+    # letters and a trailing single letter with "x"
+    if len(text) % 2 != 0:
+        text += "x"
+    i = 0
+    n = len(text)
+    while i < n:
+        a = text[i]
+        if i + 1 < n and text[i + 1] != a:
+            yield a, text[i + 1]
+            i += 2
+        else:
+            yield a, "x"
+            i += 1
+
+
+class PlayfairKey:
+    def __init__(self, matrix):
+        self.matrix = [list(row) for row in matrix]
+        self.index = {}
+        for r, row in enumerate(self.matrix):
+            for c, ch in enumerate(row):
+                self.index.setdefault(ch, (r, c))
+        # characters missing from the grid behave like findrc's (-1, -1)
+        self.classes = {ch: r * 5 + c for ch, (r, c) in self.index.items()}
+        self.encrypt_table = self._table(1)
+        self.decrypt_table = self._table(-1)
+
+    def _position(self, cls):
+        return (-1, -1) if cls == OTHER else divmod(cls, 5)
+
+    def _substitute(self, p1, p2, step):
+        # the rules from encrypt/decrypt, including their negative indexing
+        key = self.matrix
+        (r1, c1), (r2, c2) = p1, p2
+        if r1 == r2:
+            return key[r1][(c1 + step + 5) % 5] + key[r1][(c2 + step + 5) % 5]
+        if c1 == c2:
+            return key[(r1 + step + 5) % 5][c1] + key[(r2 + step + 5) % 5][c2]
+        return key[r1][c2] + key[r2][c1]
+
+    def _table(self, step):
+        positions = [self._position(cls) for cls in range(CLASSES)]
+        return [self._substitute(p1, p2, step) for p1 in positions for p2 in positions]
+
+    def findrc(self, char):
+        return self.index.get(char, (-1, -1))
+
+    def _apply(self, text, table):
+        classes = self.classes
+        return "".join(
+            table[classes.get(a, OTHER) * CLASSES + classes.get(b, OTHER)]
+            for a, b in pairs(text)
+        )
+
+    def encrypt(self, plaintxt):
+        return self._apply(plaintxt, self.encrypt_table)
+
+    def decrypt(self, ciphertxt):
+        return self._apply(ciphertxt, self.decrypt_table)
+
+    @functools.cached_property
+    def arrays(self):
+        # char code -> class lookup and the two tables as (676, 2) arrays of
+        # char codes; NumPy is only imported once a bulk call needs it
+        import numpy as np
+
+        size = max(256, max(map(ord, self.classes)) + 1)
+        classes = np.full(size, OTHER, dtype=np.uint8)
+        for ch, cls in self.classes.items():
+            classes[ord(ch)] = cls
+        dtype = np.uint8 if all(ord(ch) < 128 for ch in self.classes) else np.uint32
+        enc = np.array([[ord(c) for c in s] for s in self.encrypt_table], dtype=dtype)
+        dec = np.array([[ord(c) for c in s] for s in self.decrypt_table], dtype=dtype)
+        return classes, enc, dec
+
+    def process(self, text, decrypt=False, final=True):
+        # Splits and substitutes text without the odd-length "x" padding and
+        # returns (output, pending). With final=False a trailing pair start
+        # that still needs its partner is returned as pending instead of
+        # being closed with "x"; pending is then at most one character.
+        import numpy as np
+
+        classes, enc, dec = self.arrays
+        table = dec if decrypt else enc
+        if text.isascii():
+            codes = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+        else:
+            codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+        # genbigram turns a pair start that hits a doubled letter into [c, "x"].
+        # Pair starts keep one parity until such a split flips it, so among the
+        # doubled positions the splits are the first of every run of equal
+        # parity, skipping a leading run of odd positions.
+        doubled = np.flatnonzero(codes[:-1] == codes[1:])
+        parity = doubled & 1
+        split = np.ones(doubled.size, dtype=bool)
+        split[1:] = parity[1:] != parity[:-1]
+        if doubled.size and parity[0]:
+            split[0] = False
+        cls = np.where(
+            codes < classes.size, classes[np.minimum(codes, classes.size - 1)], OTHER
+        )
+        x = self.classes.get("x", OTHER)
+        cls = np.insert(cls.astype(np.uint16), doubled[split] + 1, x)
+        pending = ""
+        if cls.size % 2:
+            # fillers only go in before the last char, so it is the lone one
+            if final:
+                cls = np.append(cls, x)
+            else:
+                cls = cls[:-1]
+                pending = text[-1]
+        out = table[cls[0::2] * CLASSES + cls[1::2]]
+        if out.dtype == np.uint8:
+            return out.tobytes().decode("ascii"), pending
+        return out.astype("<u4").tobytes().decode("utf-32-le"), pending
+
+    def _apply_bulk(self, text, decrypt):
+        if len(text) % 2 != 0:
+            text += "x"
+        return self.process(text, decrypt)[0]
+
+    def encrypt_bulk(self, plaintxt):
+        # same output as encrypt, computed over the whole buffer with NumPy
+        return self._apply_bulk(plaintxt, decrypt=False)
+
+    def decrypt_bulk(self, ciphertxt):
+        return self._apply_bulk(ciphertxt, decrypt=True)
+
+
+class KeyCache:
+    # bounded LRU of compiled keys keyed by passphrase
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.keys = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, passphrase):
+        with self.lock:
+            key = self.keys.get(passphrase)
+            if key is not None:
+                self.keys.move_to_end(passphrase)
+                self.hits += 1
+                return key
+            self.misses += 1
+        # compile outside the lock; a concurrent miss on the same passphrase
+        # just builds an identical key twice
+        key = PlayfairKey(keygen(passphrase))
+        with self.lock:
+            self.keys[passphrase] = key
+            self.keys.move_to_end(passphrase)
+            while len(self.keys) > self.maxsize:
+                self.keys.popitem(last=False)
+                self.evictions += 1
+        return key
+
+    def stats(self):
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self.keys),
+            }
+
+    def clear(self):
+        with self.lock:
+            self.keys.clear()
+
+
+CACHE = KeyCache()
+
+
+def compile_key(passphrase):
+    return CACHE.get(passphrase)
+
+
+def lookup(key):
+    # a 5x5 matrix is cached under its 25 characters, which keygen turns back
+    # into the same matrix
+    if isinstance(key, PlayfairKey):
+        return key
+    if not isinstance(key, str):
+        key = "".join(ch for row in key for ch in row)
+    return compile_key(key)
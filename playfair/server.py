@@ -1,34 +1,10 @@
 import socket
+import sys
+import threading
 
-
-def remcommon(st):
-    visited = []
-    for i in st:
-        if i not in visited:
-            visited.append(i)
-    return "".join(visited)
-
-
-def keygen(key):
-    temp = ""
-    if "i" in key:
-        temp = "j"
-    elif "j" in key:
-        temp = "i"
-    else:
-        temp = "i"
-    keychar = remcommon(key.lower())
-    matval = remcommon(keychar.lower() + "abcdefgh" + temp + "klmnopqrstuvwxyz")
-
-    key_matrix = []
-    idx = 0
-    for i in range(5):
-        row = []
-        for j in range(5):
-            row.append(matval[idx])
-            idx += 1
-        key_matrix.append(row)
-    return key_matrix
+import playkey
+import wire
+from playkey import keygen, remcommon
 
 
 def genbigram(plaintxt):
@@ -62,22 +38,11 @@ def findrc(char, key):
 
 
 def encrypt(plaintxt, key):
-    bigram = genbigram(plaintxt)
-    subbed = ""
-    for sec in bigram:
-        r1, c1 = findrc(sec[0], key)
-        r2, c2 = findrc(sec[1], key)
-
-        if r1 == r2:
-            subbed += key[r1][(c1 + 1) % 5]
-            subbed += key[r1][(c2 + 1) % 5]
-        elif c1 == c2:
-            subbed += key[(r1 + 1) % 5][c1]
-            subbed += key[(r2 + 1) % 5][c2]
-        else:
-            subbed += key[r1][c2]
-            subbed += key[r2][c1]
-    return subbed
+    # key is the 5x5 matrix from keygen or the passphrase itself
+    key = playkey.lookup(key)
+    if len(plaintxt) >= playkey.BULK_THRESHOLD:
+        return key.encrypt_bulk(plaintxt)
+    return key.encrypt(plaintxt)
 
 
 def transmit(ciphertext, key):
@@ -93,17 +58,68 @@ def transmit(ciphertext, key):
         c.sendall(data.encode())
     finally:
         c.close()
-        # s.close()
+        s.close()
+
+
+def serve_session(listener, payload, max_connections=64, timeout=10.0):
+    # every accepted client gets its own thread and the same prebuilt frames;
+    # at most max_connections are served at once and the rest wait in the
+    # listen backlog, and a receiver that stops reading is dropped after timeout
+    slots = threading.BoundedSemaphore(max_connections)
+
+    def send(c):
+        # sendall's timeout covers the whole call, so send in pieces to make
+        # it a limit on how long the receiver may stall
+        view = memoryview(payload)
+        try:
+            for start in range(0, len(view), 64 * 1024):
+                c.sendall(view[start : start + 64 * 1024])
+        except OSError:
+            pass
+        finally:
+            c.close()
+            slots.release()
+
+    while True:
+        slots.acquire()
+        try:
+            c, addr = listener.accept()
+        except BaseException:
+            slots.release()
+            raise
+        c.settimeout(timeout)
+        threading.Thread(target=send, args=(c,), daemon=True).start()
+
+
+def transmit_session(ciphertexts, key, max_connections=64, timeout=10.0):
+    # the grid goes out once per connection, followed by every ciphertext
+    payload = wire.pack_session(ciphertexts, key)
+    s = socket.socket()
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    port = 8080
+    s.bind(("127.0.0.1", port))
+    s.listen(128)
+    try:
+        serve_session(s, payload, max_connections, timeout)
+    finally:
+        s.close()
 
 
 if __name__ == "__main__":
-    plaintxt = "attack"
-    key = "monarchy"
-    ckey = keygen(key)
-    print("Key Matrix:")
-    for i in ckey:
-        print(i)
-    ciphertext = encrypt(plaintxt, ckey)
-    print(f"Plaintext: {plaintxt}")
-    print(f"Ciphertext: {ciphertext}")
-    transmit(ciphertext, ckey)
+    if "--session" in sys.argv:
+        key = input("Enter the key: ")
+        ckey = keygen(key)
+        print("Enter one plaintext per line, end with an empty line:")
+        plaintexts = list(iter(input, ""))
+        transmit_session([encrypt(p, ckey) for p in plaintexts], ckey)
+    else:
+        plaintxt = "attack"
+        key = "monarchy"
+        ckey = keygen(key)
+        print("Key Matrix:")
+        for i in ckey:
+            print(i)
+        ciphertext = encrypt(plaintxt, ckey)
+        print(f"Plaintext: {plaintxt}")
+        print(f"Ciphertext: {ciphertext}")
+        transmit(ciphertext, ckey)
@@ -0,0 +1,88 @@
+import sys
+
+import playkey
+
+CHUNK_SIZE = 1 << 20
+
+
+class Encoder:
+    decrypt = False
+
+    def __init__(self, key):
+        # key is a passphrase, a 5x5 matrix or a compiled PlayfairKey
+        if not isinstance(key, playkey.PlayfairKey):
+            key = playkey.lookup(key)
+        self.key = key
+        self.pending = ""
+        self.length = 0
+
+    def update(self, chunk):
+        self.length += len(chunk)
+        out, self.pending = self.key.process(
+            self.pending + chunk, self.decrypt, final=False
+        )
+        return out
+
+    def finish(self):
+        # genbigram pads odd-length input with "x" before splitting; only now
+        # is the total length known
+        tail = self.pending + ("x" if self.length % 2 else "")
+        self.pending = ""
+        if not tail:
+            return ""
+        return self.key.process(tail, self.decrypt)[0]
+
+
+class Decoder(Encoder):
+    decrypt = True
+
+
+def iter_chunks(source, size=CHUNK_SIZE):
+    if not hasattr(source, "read"):
+        yield from source
+        return
+    while True:
+        chunk = source.read(size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def encrypt_stream(source, key, size=CHUNK_SIZE):
+    encoder = Encoder(key)
+    for chunk in iter_chunks(source, size):
+        yield encoder.update(chunk)
+    yield encoder.finish()
+
+
+def decrypt_stream(source, key, size=CHUNK_SIZE):
+    decoder = Decoder(key)
+    for chunk in iter_chunks(source, size):
+        yield decoder.update(chunk)
+    yield decoder.finish()
+
+
+def pipe(mode, key, src, dst, size=CHUNK_SIZE):
+    stream = encrypt_stream if mode == "encrypt" else decrypt_stream
+    total = 0
+    for chunk in stream(src, key, size):
+        dst.write(chunk)
+        total += len(chunk)
+    dst.flush()
+    return total
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3 or sys.argv[1] not in ("encrypt", "decrypt"):
+        print("Usage: stream.py encrypt|decrypt PASSPHRASE [INPUT] [OUTPUT]")
+        sys.exit(2)
+    mode, key = sys.argv[1], sys.argv[2]
+    src = open(sys.argv[3]) if len(sys.argv) > 3 else sys.stdin
+    dst = open(sys.argv[4], "w") if len(sys.argv) > 4 else sys.stdout
+    try:
+        pipe(mode, key, src, dst)
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
@@ -0,0 +1,58 @@
+import struct
+
+# frame type, body length; a KEY frame carries the 25-character grid as UTF-8
+# and applies to every MESSAGE frame after it on the same connection
+HEADER = struct.Struct("!BI")
+KEY = 1
+MESSAGE = 2
+MAX_FRAME = 64 * 1024 * 1024
+
+
+def grid(key):
+    # the row-major grid is the key reference; keygen rebuilds the same matrix
+    if isinstance(key, str):
+        return key
+    return "".join(ch for row in key for ch in row)
+
+
+def pack_key(key):
+    body = grid(key).encode()
+    return HEADER.pack(KEY, len(body)) + body
+
+
+def pack_message(ciphertxt):
+    body = ciphertxt.encode()
+    return HEADER.pack(MESSAGE, len(body)) + body
+
+
+def pack_session(ciphertexts, key):
+    # the whole session as one buffer, so a server can hand the same bytes to
+    # every client
+    return b"".join([pack_key(key)] + [pack_message(c) for c in ciphertexts])
+
+
+def recv_session(sock, max_size=MAX_FRAME):
+    # yields (grid, ciphertxt) for each message until the peer closes the
+    # connection; grid is the same str object until a new KEY frame arrives
+    key = None
+    with sock.makefile("rb") as f:
+        while True:
+            header = f.read(HEADER.size)
+            if not header:
+                return
+            if len(header) < HEADER.size:
+                raise ConnectionError("connection closed inside a frame header")
+            kind, length = HEADER.unpack(header)
+            if length > max_size:
+                raise ValueError(f"frame of {length} bytes exceeds limit")
+            body = f.read(length)
+            if len(body) < length:
+                raise ConnectionError("connection closed inside a frame")
+            if kind == KEY:
+                key = body.decode()
+            elif kind == MESSAGE:
+                if key is None:
+                    raise ValueError("message frame before any key frame")
+                yield (key, body.decode())
+            else:
+                raise ValueError(f"unknown frame type {kind}")